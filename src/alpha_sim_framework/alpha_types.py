@@ -203,6 +203,9 @@ class ProviderRuntimeConfig:
     retries: int = 1
     backoff_seconds: float = 0.2
     cache_ttl_seconds: int = 300
+    cache_max_entries: int = 256
+    failed_fetch_cache_ttl_seconds: int = 30
+    stale_cache_max_age_seconds: int = 3600
     degrade_gracefully: bool = True
     as_of_utc: Optional[str] = None
     as_of_date: Optional[str] = None
@@ -233,6 +236,7 @@ class ProviderRuntimeConfig:
     canonical_contract_domains: List[str] = field(
         default_factory=lambda: ["weather", "market", "odds", "injury_news", "nextgenstats"]
     )
+    signal_float32: bool = False
 
 
 @dataclass
@@ -246,3 +250,4 @@ class CompositeAlphaConfig:
     schedule_horizon_weeks: int = 4
     min_recent_points: int = 2
     enable_extended_signals: bool = False
+    collect_diagnostics: bool = True
@@ -217,24 +217,26 @@ def _validate_nextgenstats_data(data: Dict[str, Any]) -> List[str]:
     return errors
 
 
-def validate_canonical_feed(domain: str, payload: Dict[str, Any]) -> List[str]:
+def validate_canonical_feed_data(domain: str, data: Dict[str, Any]) -> List[str]:
     domain_key = str(domain or "").strip().lower()
-    errors = validate_feed_envelope(payload)
-    data = _as_dict(payload.get("data"))
+    data = _as_dict(data)
 
     if domain_key == "weather":
-        errors.extend(_validate_weather_data(data))
-    elif domain_key == "market":
-        errors.extend(_validate_market_data(data))
-    elif domain_key == "odds":
-        errors.extend(_validate_odds_data(data))
-    elif domain_key in {"injury_news", "injury-news"}:
-        errors.extend(_validate_injury_data(data))
-    elif domain_key == "nextgenstats":
-        errors.extend(_validate_nextgenstats_data(data))
-    else:
-        errors.append(f"unsupported_domain:{domain}")
+        return _validate_weather_data(data)
+    if domain_key == "market":
+        return _validate_market_data(data)
+    if domain_key == "odds":
+        return _validate_odds_data(data)
+    if domain_key in {"injury_news", "injury-news"}:
+        return _validate_injury_data(data)
+    if domain_key == "nextgenstats":
+        return _validate_nextgenstats_data(data)
+    return [f"unsupported_domain:{domain}"]
+
 
+def validate_canonical_feed(domain: str, payload: Dict[str, Any]) -> List[str]:
+    errors = validate_feed_envelope(payload)
+    errors.extend(validate_canonical_feed_data(domain, payload.get("data")))
     return errors
 
 
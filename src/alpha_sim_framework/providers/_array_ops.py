@@ -0,0 +1,30 @@
+from typing import Tuple
+
+import numpy as np
+
+
+def clip_array(values: np.ndarray, low: float, high: float, nan_to_high: bool = False) -> np.ndarray:
+    """Elementwise clip to ``[low, high]``.
+
+    NaN values pass through, as with ``np.clip``; ``nan_to_high`` instead matches the builtin
+    ``max(low, min(high, value))``, which maps NaN to ``high``.
+    """
+    if nan_to_high:
+        values = np.where(values < high, values, high)
+        return np.where(values > low, values, low)
+    values = np.where(values < low, low, values)
+    return np.where(values > high, high, values)
+
+
+def window_averages(
+    recent_points: np.ndarray, recent_count: np.ndarray, baseline: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Mean of the latest three and the three weeks before them, or ``baseline`` where a window is empty.
+
+    ``recent_points`` is (players, 6), most recent week first and zero-padded past ``recent_count``.
+    """
+    recent_n = np.minimum(recent_count, 3.0)
+    older_n = np.clip(recent_count - 3.0, 0.0, 3.0)
+    recent_avg = np.where(recent_n > 0, recent_points[:, :3].sum(axis=1) / np.maximum(recent_n, 1.0), baseline)
+    older_avg = np.where(older_n > 0, recent_points[:, 3:].sum(axis=1) / np.maximum(older_n, 1.0), baseline)
+    return recent_avg, older_avg
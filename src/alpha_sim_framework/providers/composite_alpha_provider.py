@@ -1,9 +1,14 @@
+import asyncio
 import copy
+import json
+import sys
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import asdict, is_dataclass
+from collections import OrderedDict
+from concurrent.futures import ALL_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, fields, is_dataclass, replace
 from datetime import date, datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
 
 import numpy as np
 
@@ -15,6 +20,7 @@ from ..alpha_types import (
     SignalWeights,
 )
 from ..feed_contracts import validate_canonical_feed
+from ._array_ops import clip_array, window_averages
 from .feeds import (
     InjuryNewsFeedClient,
     MarketFeedClient,
@@ -49,8 +55,91 @@ EXTENDED_SIGNAL_NAMES = (
     "line_movement",
 )
 
+POSITION_INDEX = {"QB": 0, "RB": 1, "WR": 2, "TE": 3, "K": 4, "D/ST": 5}
+OTHER_POSITION_INDEX = len(POSITION_INDEX)
+USAGE_SCALE = (0.85, 1.15, 1.10, 0.90, 0.40, 0.40, 1.0)
+ROUTE_USAGE_POSITION = (False, False, True, True, False, False, False)
+SCRIPT_BASE_FAVORITE = (-0.30, 0.40, -0.30, -0.30, 0.05, 0.05, 0.05)
+SCRIPT_BASE_UNDERDOG = (0.35, -0.25, 0.35, 0.35, 0.05, 0.05, 0.05)
+DOME_BONUS = (0.15, 0.05, 0.15, 0.15, 0.05, 0.05, 0.05)
+WEATHER_EXPOSED_POSITION = (True, False, True, True, True, False, False)
+WIN_PROBABILITY_POSITION_WEIGHT = (-1.0, 0.95, -0.85, -0.60, 0.20, 0.25, 0.0)
+BACKUP_POSITION_WEIGHT = (1.0, 0.4, 0.2, 0.3, 0.1, 0.15, 0.0)
+LINE_MOVE_POSITION_WEIGHT = (0.15, 0.20, 0.15, 0.10, 0.05, 0.12, 0.08)
+_USAGE_SCALE_LUT = np.array(USAGE_SCALE)
+_ROUTE_USAGE_LUT = np.array(ROUTE_USAGE_POSITION)
+_SCRIPT_FAVORITE_LUT = np.array(SCRIPT_BASE_FAVORITE)
+_SCRIPT_UNDERDOG_LUT = np.array(SCRIPT_BASE_UNDERDOG)
+_DOME_BONUS_LUT = np.array(DOME_BONUS)
+_WEATHER_EXPOSED_LUT = np.array(WEATHER_EXPOSED_POSITION)
+_WIN_PROBABILITY_WEIGHT_LUT = np.array(WIN_PROBABILITY_POSITION_WEIGHT)
+_BACKUP_WEIGHT_LUT = np.array(BACKUP_POSITION_WEIGHT)
+_LINE_MOVE_WEIGHT_LUT = np.array(LINE_MOVE_POSITION_WEIGHT)
+INJURY_STATUS_COMPONENT = {
+    "OUT": -3.0,
+    "IR": -3.0,
+    "DOUBTFUL": -1.8,
+    "QUESTIONABLE": -0.8,
+    "P": -0.4,
+    "SUSPENSION": -2.5,
+}
+STATUS_INDEX = {
+    status: index for index, status in enumerate(sorted(HEALTHY_STATUSES | OUTLIKE_STATUSES | set(INJURY_STATUS_COMPONENT)))
+}
+OTHER_STATUS_INDEX = len(STATUS_INDEX)
+_STATUS_COMPONENT_LUT = np.array([INJURY_STATUS_COMPONENT.get(status, 0.0) for status in STATUS_INDEX] + [0.0])
+_STATUS_OUTLIKE_LUT = np.array([status in OUTLIKE_STATUSES for status in STATUS_INDEX] + [False])
+_STATUS_HEALTHY_LUT = np.array([status in HEALTHY_STATUSES for status in STATUS_INDEX] + [False])
+FRAME_COLUMNS = (
+    "pos_code",
+    "baseline",
+    "residual",
+    "has_usage",
+    "usage",
+    "ng_usage_over_expected",
+    "ng_route_participation",
+    "ng_avg_separation",
+    "ng_explosive_play_rate",
+    "has_ng_volatility_index",
+    "ng_volatility_index",
+    "recent_count",
+    "status_code",
+    "dvp",
+    "spread",
+    "implied_total",
+    "is_dome",
+    "wind_mph",
+    "precip_prob",
+    "started_pct",
+    "sentiment_score",
+    "start_delta",
+    "schedule_strength",
+)
+EXTENDED_FRAME_COLUMNS = (
+    "ownership",
+    "has_props",
+    "line_open",
+    "line_current",
+    "sharp_over_pct",
+    "backup_ratio",
+    "red_zone_touch_share",
+    "red_zone_touch_trend",
+    "has_snap_share",
+    "snap_share",
+    "snap_share_trend",
+    "live_weight",
+    "score_pressure",
+    "has_live_context",
+    "team_win_prob",
+    "spread_move_direction",
+    "spread_move_magnitude",
+)
+_MISSING = object()
+
 
 def _safe_float(value: Any, default: float = 0.0) -> float:
+    if type(value) is float:
+        return value
     try:
         return float(value)
     except Exception:
@@ -61,39 +150,73 @@ def _as_dict(value: Any) -> Dict[Any, Any]:
     return value if isinstance(value, dict) else {}
 
 
+def _unpack(feed: Any) -> Dict[Any, Any]:
+    data = feed.get("data") if isinstance(feed, dict) else None
+    return data if isinstance(data, dict) else {}
+
+
 def _cap(value: float, bounds: Tuple[float, float]) -> float:
     low, high = bounds
-    return float(np.clip(_safe_float(value), _safe_float(low), _safe_float(high)))
+    if type(value) is not float:
+        value = _safe_float(value)
+    if type(low) is not float:
+        low = _safe_float(low)
+    if value < low:
+        value = low
+    if type(high) is not float:
+        high = _safe_float(high)
+    if value > high:
+        value = high
+    return value
+
+
+def _cap_array(values: np.ndarray, bounds: Tuple[float, float]) -> np.ndarray:
+    return clip_array(values, _safe_float(bounds[0]), _safe_float(bounds[1]))
+
+
+def _percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    arr = np.array(values, dtype=float)
+    rank = (arr.size - 1) * (q / 100.0)
+    low = int(rank)
+    high = min(low + 1, arr.size - 1)
+    arr.partition((low, high) if high != low else low)
+    if np.isnan(arr).any():
+        return float("nan")
+    low_value = float(arr[low])
+    return low_value + (float(arr[high]) - low_value) * (rank - low)
 
 
 def _player_id(player: Any) -> Any:
-    return getattr(player, "playerId", getattr(player, "name", id(player)))
+    player_id = getattr(player, "playerId", _MISSING)
+    if player_id is _MISSING:
+        player_id = getattr(player, "name", _MISSING)
+    return id(player) if player_id is _MISSING else player_id
 
 
 def _normalize_status(status: Any) -> str:
-    return str(status or "NONE").strip().upper()
+    return sys.intern(str(status or "NONE").strip().upper())
 
 
-def _lookup(mapping: Dict[Any, Any], key: Any, default: Any = None) -> Any:
-    if key in mapping:
-        return mapping[key]
+def _canonical_key(key: Any) -> Any:
+    if isinstance(key, str):
+        digits = key[1:] if key[:1] == "-" else key
+        return int(key) if digits.isdecimal() else key
+    if isinstance(key, float) and key.is_integer():
+        return int(key)
+    return key
 
-    key_str = str(key)
-    if key_str in mapping:
-        return mapping[key_str]
 
-    try:
-        key_int = int(key)
-    except Exception:
-        key_int = None
-
-    if key_int is not None:
-        if key_int in mapping:
-            return mapping[key_int]
-        if str(key_int) in mapping:
-            return mapping[str(key_int)]
-
-    return default
+def _index_by_key(mapping: Any) -> Dict[Any, Any]:
+    # On collisions the key already in canonical form wins, so an int key beats its string twin.
+    index: Dict[Any, Any] = {}
+    for key, value in _as_dict(mapping).items():
+        canonical = _canonical_key(key)
+        if canonical in index and canonical != key:
+            continue
+        index[canonical] = value
+    return index
 
 
 def _as_string_list(value: Any) -> List[str]:
@@ -152,9 +275,19 @@ def _coerce_dataclass(instance: Any, values: Dict[str, Any]) -> Any:
     return instance
 
 
+def _clone_config(value: Any) -> Any:
+    if is_dataclass(value) and not isinstance(value, type):
+        return replace(value, **{item.name: _clone_config(getattr(value, item.name)) for item in fields(value) if item.init})
+    if isinstance(value, dict):
+        return {key: _clone_config(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_clone_config(item) for item in value]
+    return value
+
+
 def _to_composite_config(config: Optional[Any], kwargs: Optional[Dict[str, Any]] = None) -> CompositeAlphaConfig:
     if isinstance(config, CompositeAlphaConfig):
-        payload = copy.deepcopy(config)
+        payload = _clone_config(config)
         return _coerce_dataclass(payload, kwargs or {})
 
     payload = CompositeAlphaConfig()
@@ -166,6 +299,7 @@ def _to_composite_config(config: Optional[Any], kwargs: Optional[Dict[str, Any]]
 
 def _player_recent_points(player: Any, week: int) -> List[float]:
     stats = _as_dict(getattr(player, "stats", {}))
+    week = int(week)
     points = []
     for stat_week, entry in stats.items():
         entry = _as_dict(entry)
@@ -175,7 +309,7 @@ def _player_recent_points(player: Any, week: int) -> List[float]:
             week_id = int(stat_week)
         except Exception:
             continue
-        if week_id <= 0 or week_id > int(week):
+        if week_id <= 0 or week_id > week:
             continue
         points.append((week_id, _safe_float(entry.get("points"))))
 
@@ -196,7 +330,15 @@ def _player_baseline(player: Any, reg_games: int) -> float:
 
 
 def _position(player: Any) -> str:
-    return str(getattr(player, "position", "") or "").upper()
+    return sys.intern(str(getattr(player, "position", "") or "").upper())
+
+
+def _league_key(league: Any, week: int) -> Tuple[int, int, int]:
+    return (
+        int(getattr(league, "league_id", 0) or 0),
+        int(getattr(league, "year", 0) or 0),
+        int(week),
+    )
 
 
 def _team_id(team_ref: Any) -> Optional[int]:
@@ -206,27 +348,308 @@ def _team_id(team_ref: Any) -> Optional[int]:
         return None
 
 
+def _recent_form(
+    recent_points: np.ndarray, recent_count: np.ndarray, baseline: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    recent_avg, older_avg = window_averages(recent_points, recent_count, baseline)
+    mean = recent_points.sum(axis=1) / np.maximum(recent_count, 1.0)
+    in_window = np.arange(recent_points.shape[1]) < recent_count[:, None]
+    deviations = np.where(in_window, recent_points - mean[:, None], 0.0)
+    squares = (deviations * deviations).sum(axis=1)
+    fallback = baseline * 0.2
+    fallback = np.where(fallback > 2.0, fallback, 2.0)
+    volatility = np.where(recent_count >= 2, np.sqrt(squares / np.maximum(recent_count - 1.0, 1.0)), fallback)
+    return recent_avg, older_avg, volatility
+
+
+def _compute_signal_matrix(frame: Dict[str, np.ndarray], params: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
+    # Returns the raw (players, signals) matrix in BASE_SIGNAL_NAMES (+ EXTENDED_SIGNAL_NAMES)
+    # column order and the per-player matchup signal multiplier.
+    pos_code = frame["pos_code"]
+    baseline = frame["baseline"]
+    residual = frame["residual"]
+    dvp = frame["dvp"]
+    spread = frame["spread"]
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        projection_residual = params["residual_scale"] * residual
+        projection_residual += 0.20 * frame["ng_explosive_play_rate"]
+        projection_residual += 0.10 * frame["ng_avg_separation"]
+
+        recent_avg, older_avg, volatility = _recent_form(frame["recent_points"], frame["recent_count"], baseline)
+        usage_value = np.where(frame["has_usage"], frame["usage"], recent_avg - older_avg)
+        usage_value += 0.30 * frame["ng_usage_over_expected"]
+        usage_value = np.where(
+            _ROUTE_USAGE_LUT[pos_code],
+            usage_value + 0.12 * frame["ng_route_participation"],
+            usage_value,
+        )
+        usage_trend = params["usage_scale"] * usage_value * _USAGE_SCALE_LUT[pos_code]
+
+        teammate_out = np.maximum(0, frame["teammate_out"])
+        status_code = frame["status_code"]
+        teammate_out = np.where(_STATUS_OUTLIKE_LUT[status_code], np.maximum(0, teammate_out - 1), teammate_out)
+        injury_opportunity = _STATUS_COMPONENT_LUT[status_code] + np.where(
+            _STATUS_HEALTHY_LUT[status_code] & (teammate_out > 0), 0.8 * teammate_out, 0.0
+        )
+
+        matchup_unit = 0.2 * dvp
+        matchup_signal_multiplier = _cap_array(1.0 + (0.025 * dvp), params["matchup_signal_cap"])
+
+        script_base = np.where(
+            spread < 0,
+            _SCRIPT_FAVORITE_LUT[pos_code],
+            _SCRIPT_UNDERDOG_LUT[pos_code],
+        )
+        game_script = script_base + (0.08 * ((frame["implied_total"] - 22.0) / 3.0))
+
+        ng_volatility_index = np.where(frame["has_ng_volatility_index"], frame["ng_volatility_index"], volatility)
+        volatility_proxy = (0.55 * volatility) + (0.45 * ng_volatility_index)
+        volatility_proxy = np.where(volatility_proxy > 0.0, volatility_proxy, 0.0)
+        volatility_aware = (-0.08 * volatility_proxy) + np.where(volatility_proxy < 4.0, 0.25, 0.0)
+
+        is_dome = frame["is_dome"]
+        outdoor = ~is_dome
+        exposed = _WEATHER_EXPOSED_LUT[pos_code]
+        wind_mph = frame["wind_mph"]
+        weather_venue = np.where(is_dome, 0.0 + _DOME_BONUS_LUT[pos_code], 0.0)
+        weather_venue = np.where(outdoor & (wind_mph >= 15), weather_venue - np.where(exposed, 0.5, 0.1), weather_venue)
+        weather_venue = np.where(outdoor & (wind_mph >= 22), weather_venue - np.where(exposed, 0.4, 0.1), weather_venue)
+        weather_venue = np.where(
+            outdoor & (frame["precip_prob"] >= 0.4), weather_venue - np.where(exposed, 0.4, 0.05), weather_venue
+        )
+
+        started_pct = frame["started_pct"]
+        market_sentiment_contrarian = -0.5 * frame["sentiment_score"]
+        fade = np.abs(residual) * 0.12
+        market_sentiment_contrarian = np.where(
+            (started_pct >= 75) & (residual < 0),
+            market_sentiment_contrarian - np.where(fade < 1.0, fade, 1.0),
+            market_sentiment_contrarian,
+        )
+        boost = residual * 0.12
+        market_sentiment_contrarian = np.where(
+            (started_pct <= 40) & (residual > 0),
+            market_sentiment_contrarian + np.where(boost < 1.0, boost, 1.0),
+            market_sentiment_contrarian,
+        )
+        market_sentiment_contrarian -= 0.10 * frame["start_delta"]
+
+        waiver_replacement_value = (0.03 * (baseline - frame["replacement"])) + (0.08 * (baseline - frame["starter"]))
+        short_term_schedule_cluster = (0.25 * frame["schedule_strength"]) + (0.05 * dvp)
+
+        columns: List[np.ndarray] = [
+            projection_residual,
+            usage_trend,
+            injury_opportunity,
+            matchup_unit,
+            game_script,
+            volatility_aware,
+            weather_venue,
+            market_sentiment_contrarian,
+            waiver_replacement_value,
+            short_term_schedule_cluster,
+        ]
+
+        if params["use_extended_signals"]:
+            residual_denom = baseline * 0.35
+            residual_denom = np.where(residual_denom > 2.0, residual_denom, 2.0)
+            residual_z_score = residual / residual_denom
+            np.clip(residual_z_score, -2.5, 2.5, out=residual_z_score)
+            player_tilt_leverage = 2.0 * (frame["position_ownership"] - frame["ownership"]) * residual_z_score
+
+            line_open = frame["line_open"]
+            line_current = frame["line_current"]
+            abs_baseline = np.abs(baseline)
+            abs_open = np.abs(line_open)
+            line_edge = (line_current - baseline) / np.where(abs_baseline > 5.0, abs_baseline, 5.0)
+            line_move = (line_current - line_open) / np.where(abs_open > 3.0, abs_open, 3.0)
+            sharp_over_pct = np.clip(frame["sharp_over_pct"], 0.0, 1.0)
+            vegas_props = np.where(
+                frame["has_props"],
+                (3.0 * line_edge) + (1.8 * line_move) + (1.5 * (sharp_over_pct - 0.5)),
+                0.0,
+            )
+
+            team_win_prob = frame["team_win_prob"]
+            live_weight = frame["live_weight"]
+            score_pressure = frame["score_pressure"]
+            wp_position_weight = _WIN_PROBABILITY_WEIGHT_LUT[pos_code]
+            win_probability_script = np.where(
+                frame["has_live_context"],
+                (1.8 * (team_win_prob - 0.5) * wp_position_weight)
+                + (0.7 * live_weight * score_pressure * wp_position_weight),
+                0.0,
+            )
+
+            backup_ratio = frame["backup_ratio"]
+            backup_weight = _BACKUP_WEIGHT_LUT[pos_code]
+            backup_quality_adjustment = np.where(
+                backup_ratio >= 0.0,
+                np.where(backup_ratio < 0.40, 0.15 * backup_weight, np.where(backup_ratio > 0.80, -0.10 * backup_weight, 0.0)),
+                0.0,
+            )
+
+            red_zone_opportunity = (0.20 * np.clip(frame["red_zone_touch_share"], 0.0, 1.0)) + (
+                0.30 * np.clip(frame["red_zone_touch_trend"], -1.0, 1.0)
+            )
+
+            snap_share_level = np.clip(frame["snap_share"], 0.0, 1.0)
+            snap_share_level -= 0.50
+            snap_share_level /= 0.30
+            np.clip(snap_share_level, -1.0, 1.0, out=snap_share_level)
+            snap_trend_level = np.clip(frame["snap_share_trend"], -1.0, 1.0)
+            snap_trend_level /= 0.10
+            np.clip(snap_trend_level, -1.0, 1.0, out=snap_trend_level)
+            snap_count_percentage = np.where(
+                frame["has_snap_share"], (0.20 * snap_share_level) + (0.30 * snap_trend_level), 0.0
+            )
+
+            line_movement = (
+                _LINE_MOVE_WEIGHT_LUT[pos_code] * frame["spread_move_direction"] * frame["spread_move_magnitude"]
+            )
+
+            columns.extend(
+                [
+                    player_tilt_leverage,
+                    vegas_props,
+                    win_probability_script,
+                    backup_quality_adjustment,
+                    red_zone_opportunity,
+                    snap_count_percentage,
+                    line_movement,
+                ]
+            )
+
+    signals = np.empty((pos_code.size, len(columns)), dtype=float)
+    for index, column in enumerate(columns):
+        signals[:, index] = column
+    return signals, np.asarray(matchup_signal_multiplier, dtype=float)
+
+
+def _frame_columns(rows: List[Tuple[Any, ...]], columns: Tuple[str, ...]) -> Dict[str, np.ndarray]:
+    matrix = np.array(rows, dtype=float).reshape(len(rows), len(columns))
+    frame = {name: matrix[:, index].copy() for index, name in enumerate(columns)}
+    for name in columns:
+        if name.endswith("_code"):
+            frame[name] = frame[name].astype(np.intp)
+        elif name.startswith(("is_", "has_")):
+            frame[name] = frame[name].astype(bool)
+    return frame
+
+
+_SCALAR_TYPES = (float, int, str, bool, type(None))
+
+
+def _copy_metrics(metrics: Dict[str, Any]) -> Dict[str, Any]:
+    for value in metrics.values():
+        if type(value) not in _SCALAR_TYPES:
+            return copy.deepcopy(metrics)
+    return dict(metrics)
+
+
+@dataclass
+class _PlayerDiagnostic:
+    __slots__ = (
+        "player",
+        "team_id",
+        "position",
+        "nextgen_metrics",
+        "signal_names",
+        "signal_weights",
+        "signals",
+        "weighted_sum",
+        "final_adjustment",
+        "matchup_multiplier",
+        "injury_status",
+        "extended_signals_enabled",
+    )
+    player: Any
+    team_id: int
+    position: str
+    nextgen_metrics: Dict[Any, Any]
+    signal_names: Tuple[str, ...]
+    signal_weights: Tuple[float, ...]
+    signals: List[float]
+    weighted_sum: float
+    final_adjustment: float
+    matchup_multiplier: float
+    injury_status: str
+    extended_signals_enabled: bool
+
+    def as_dict(self, copy_metrics: bool = True) -> Dict[str, Any]:
+        return {
+            "player": self.player,
+            "team_id": self.team_id,
+            "position": self.position,
+            "nextgen_metrics": _copy_metrics(self.nextgen_metrics) if copy_metrics else self.nextgen_metrics,
+            "signals": dict(zip(self.signal_names, self.signals)),
+            "weighted_signals": {
+                name: value * weight for name, value, weight in zip(self.signal_names, self.signals, self.signal_weights)
+            },
+            "weighted_sum": self.weighted_sum,
+            "final_adjustment": self.final_adjustment,
+            "matchup_multiplier": self.matchup_multiplier,
+            "injury_status": self.injury_status,
+            "extended_signals_enabled": self.extended_signals_enabled,
+        }
+
+
+class _DiagnosticsView(Mapping):
+    # Entries share nextgen_metrics with the cache, so callers must not mutate them.
+    def __init__(self, records: Dict[Any, _PlayerDiagnostic]):
+        self._records = records
+
+    def __getitem__(self, pid: Any) -> Dict[str, Any]:
+        return self._records[pid].as_dict(copy_metrics=False)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+
+class _FeedRegistry(dict):
+    def __init__(self, factories: Dict[str, Any], config: CompositeAlphaConfig):
+        super().__init__()
+        self._factories = factories
+        self._config = config
+        self.names = tuple(factories)
+
+    def __missing__(self, feed_name: str) -> Any:
+        client = self._factories[feed_name](self._config.external_feeds, self._config.runtime)
+        return self.setdefault(feed_name, client)
+
+
 class CompositeSignalProvider:
     """Online composite alpha provider with graceful degradation and signal diagnostics."""
 
     def __init__(self, config: Optional[Any] = None, **kwargs: Any):
         self.config = _to_composite_config(config, kwargs=kwargs)
         self._validate_runtime_as_of_config()
-        self._feeds = {
-            "weather": WeatherFeedClient(self.config.external_feeds, self.config.runtime),
-            "market": MarketFeedClient(self.config.external_feeds, self.config.runtime),
-            "odds": OddsFeedClient(self.config.external_feeds, self.config.runtime),
-            "injury_news": InjuryNewsFeedClient(self.config.external_feeds, self.config.runtime),
-            "nextgenstats": NextGenStatsFeedClient(self.config.external_feeds, self.config.runtime),
-        }
+        self._feeds = _FeedRegistry(
+            {
+                "weather": WeatherFeedClient,
+                "market": MarketFeedClient,
+                "odds": OddsFeedClient,
+                "injury_news": InjuryNewsFeedClient,
+                "nextgenstats": NextGenStatsFeedClient,
+            },
+            self.config,
+        )
 
-        self._feed_cache: Dict[Tuple[str, int, int, int], Dict[str, Any]] = {}
-        self._feed_cache_ts: Dict[Tuple[str, int, int, int], float] = {}
-        self._week_cache: Dict[Tuple[int, int, int], Dict[str, Any]] = {}
-        self._week_cache_ts: Dict[Tuple[int, int, int], float] = {}
+        # Entries are stamped with time.monotonic() so TTLs are immune to wall-clock jumps.
+        self._feed_cache: "OrderedDict[Tuple[str, int, int, int], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._week_cache: "OrderedDict[Tuple[int, int, int], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._last_cache_sweep = 0.0
 
-        self._last_diagnostics: Dict[Any, Dict[str, Any]] = {}
+        self._last_diagnostics: Dict[Any, _PlayerDiagnostic] = {}
         self._last_warnings: List[str] = []
+        self._signal_plan_cache: Optional[Tuple[Tuple[int, int, bool], Tuple[Any, ...]]] = None
+        self._contract_cache: Optional[Tuple[Tuple[Any, ...], Tuple[str, frozenset]]] = None
+        self._feed_pool: Optional[ThreadPoolExecutor] = None
 
     def _validate_runtime_as_of_config(self) -> None:
         runtime = self.config.runtime
@@ -264,12 +687,22 @@ class CompositeSignalProvider:
 
     @property
     def last_diagnostics(self) -> Dict[Any, Dict[str, Any]]:
-        return copy.deepcopy(self._last_diagnostics)
+        return {pid: record.as_dict() for pid, record in self._last_diagnostics.items()}
+
+    @property
+    def last_diagnostics_view(self) -> Mapping[Any, Dict[str, Any]]:
+        return _DiagnosticsView(self._last_diagnostics)
 
     @property
     def last_warnings(self) -> List[str]:
         return list(self._last_warnings)
 
+    def last_diagnostics_json(self) -> str:
+        return json.dumps(
+            {str(pid): record.as_dict(copy_metrics=False) for pid, record in self._last_diagnostics.items()},
+            default=str,
+        )
+
     def get_player_adjustments(self, league: Any, week: int) -> Dict[Any, float]:
         payload = self._get_week_payload(league, week)
         return dict(payload["player_adjustments"])
@@ -282,46 +715,130 @@ class CompositeSignalProvider:
         payload = self._get_week_payload(league, week)
         return dict(payload["matchup_overrides"])
 
-    def _get_week_payload(self, league: Any, week: int) -> Dict[str, Any]:
-        key = (
-            int(getattr(league, "league_id", 0) or 0),
-            int(getattr(league, "year", 0) or 0),
-            int(week),
+    def get_adjustment_vectors(self, league: Any, week: int) -> Tuple[Dict[Any, int], np.ndarray, np.ndarray]:
+        payload = self._get_week_payload(league, week)
+        return (
+            dict(payload["pid_index"]),
+            payload["player_adjustment_vector"].copy(),
+            payload["matchup_override_vector"].copy(),
         )
-        ttl = max(0, int(getattr(self.config.runtime, "cache_ttl_seconds", 300)))
 
-        if key in self._week_cache and ttl > 0:
-            age = time.time() - self._week_cache_ts.get(key, 0.0)
-            if age <= ttl:
-                cached = self._week_cache[key]
-                self._last_diagnostics = copy.deepcopy(cached.get("diagnostics", {}))
-                self._last_warnings = list(cached.get("warnings", []))
-                return copy.deepcopy(cached)
+    def close(self) -> None:
+        if self._feed_pool is not None:
+            self._feed_pool.shutdown(wait=True)
+            self._feed_pool = None
+
+    def _signal_plan(self) -> Tuple[Tuple[str, ...], np.ndarray, np.ndarray, np.ndarray]:
+        use_extended_signals = bool(getattr(self.config, "enable_extended_signals", False))
+        stamp = (id(self.config.weights), id(self.config.caps), use_extended_signals)
+        if self._signal_plan_cache is not None and self._signal_plan_cache[0] == stamp:
+            return self._signal_plan_cache[1]
+
+        signal_names = BASE_SIGNAL_NAMES + EXTENDED_SIGNAL_NAMES if use_extended_signals else BASE_SIGNAL_NAMES
+        weights = asdict(self.config.weights)
+        positive_weights = [max(0.0, _safe_float(weights.get(name, 0.0), 0.0)) for name in signal_names]
+        weight_sum = sum(positive_weights)
+        if weight_sum <= 0:
+            weight_vec = np.full(len(signal_names), 1.0 / max(1, len(signal_names)), dtype=float)
+        else:
+            weight_vec = np.array(positive_weights, dtype=float) / weight_sum
+
+        cap_bounds = np.array(
+            [
+                (_safe_float(low), _safe_float(high))
+                for low, high in (getattr(self.config.caps, name) for name in signal_names)
+            ],
+            dtype=float,
+        ).reshape(len(signal_names), 2)
+
+        plan = (signal_names, weight_vec, cap_bounds[:, 0].copy(), cap_bounds[:, 1].copy())
+        self._signal_plan_cache = (stamp, plan)
+        return plan
+
+    def _cache_get(self, cache: "OrderedDict[Any, Tuple[float, Dict[str, Any]]]", key: Any, ttl: int) -> Optional[Dict[str, Any]]:
+        if ttl <= 0:
+            return None
+        with self._cache_lock:
+            entry = cache.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] > ttl:
+                del cache[key]
+                return None
+            cache.move_to_end(key)
+            return entry[1]
+
+    def _cache_put(
+        self,
+        cache: "OrderedDict[Any, Tuple[float, Dict[str, Any]]]",
+        key: Any,
+        payload: Dict[str, Any],
+        expires_in: Optional[int] = None,
+    ) -> None:
+        max_entries = max(1, int(getattr(self.config.runtime, "cache_max_entries", 256) or 256))
+        ttl = self._cache_ttl()
+        now = time.monotonic()
+        # A shorter lifetime is stored as a back-dated stamp, so reads keep a single TTL check.
+        stamp = now if expires_in is None else now - max(0, ttl - expires_in)
+        with self._cache_lock:
+            cache[key] = (stamp, payload)
+            cache.move_to_end(key)
+            while len(cache) > max_entries:
+                cache.popitem(last=False)
+            if now - self._last_cache_sweep > max(60, ttl):
+                self._last_cache_sweep = now
+                for store in (self._week_cache, self._feed_cache):
+                    for stale_key in [item for item, entry in store.items() if now - entry[0] > ttl]:
+                        del store[stale_key]
+
+    def _cache_ttl(self) -> int:
+        return max(0, int(getattr(self.config.runtime, "cache_ttl_seconds", 300)))
+
+    def _get_week_payload(self, league: Any, week: int) -> Dict[str, Any]:
+        key = _league_key(league, week)
+        ttl = self._cache_ttl()
+
+        # Cached payloads are shared by reference and must be treated as read-only.
+        cached = self._cache_get(self._week_cache, key, ttl)
+        if cached is not None:
+            self._last_diagnostics = cached.get("diagnostics", {})
+            self._last_warnings = cached.get("warnings", [])
+            return cached
 
         payload = self._build_week_payload(league, int(week))
-        self._week_cache[key] = copy.deepcopy(payload)
-        self._week_cache_ts[key] = time.time()
+        self._cache_put(self._week_cache, key, payload)
 
-        self._last_diagnostics = copy.deepcopy(payload.get("diagnostics", {}))
-        self._last_warnings = list(payload.get("warnings", []))
+        self._last_diagnostics = payload.get("diagnostics", {})
+        self._last_warnings = payload.get("warnings", [])
         return payload
 
     def _fetch_feed(self, feed_name: str, league: Any, week: int) -> Dict[str, Any]:
-        key = (
-            feed_name,
-            int(getattr(league, "league_id", 0) or 0),
-            int(getattr(league, "year", 0) or 0),
-            int(week),
-        )
-        ttl = max(0, int(getattr(self.config.runtime, "cache_ttl_seconds", 300)))
-
-        if key in self._feed_cache and ttl > 0:
-            age = time.time() - self._feed_cache_ts.get(key, 0.0)
-            if age <= ttl:
-                return copy.deepcopy(self._feed_cache[key])
-
+        key = (feed_name,) + _league_key(league, week)
+        cached = self._cache_get(self._feed_cache, key, self._cache_ttl())
+        if cached is not None:
+            return cached
+        return self._load_feed(feed_name, key, league, week)
+
+    def _load_feed(self, feed_name: str, key: Tuple[str, int, int, int], league: Any, week: int) -> Dict[str, Any]:
+        payload = self._feeds[feed_name].fetch(league, week)
+        return self._store_feed_payload(feed_name, key, payload, league, week)
+
+    async def _load_feed_async(
+        self, feed_name: str, key: Tuple[str, int, int, int], league: Any, week: int
+    ) -> Dict[str, Any]:
         client = self._feeds[feed_name]
-        payload = client.fetch(league, week)
+        loop = asyncio.get_running_loop()
+        pool = self._get_feed_pool()
+        fetch_async = getattr(client, "fetch_async", None)
+        if callable(fetch_async):
+            payload = await fetch_async(league, week)
+        else:
+            payload = await loop.run_in_executor(pool, client.fetch, league, week)
+        return await loop.run_in_executor(pool, self._store_feed_payload, feed_name, key, payload, league, week)
+
+    def _store_feed_payload(
+        self, feed_name: str, key: Tuple[str, int, int, int], payload: Any, league: Any, week: int
+    ) -> Dict[str, Any]:
         if not isinstance(payload, dict):
             payload = {
                 "data": {},
@@ -334,23 +851,28 @@ class CompositeSignalProvider:
         payload = self._append_snapshot_record(feed_name, payload, league, week)
         payload = self._resolve_as_of_payload(feed_name, payload, league, week)
 
-        self._feed_cache[key] = copy.deepcopy(payload)
-        self._feed_cache_ts[key] = time.time()
+        self._cache_put(self._feed_cache, key, payload)
         return payload
 
-    def _contract_mode(self) -> str:
-        mode = str(getattr(self.config.runtime, "canonical_contract_mode", "warn") or "warn").strip().lower()
-        if mode in {"off", "warn", "strict"}:
-            return mode
-        return "warn"
-
-    def _contract_domains(self) -> set:
-        configured = getattr(self.config.runtime, "canonical_contract_domains", None)
+    def _contract_settings(self) -> Tuple[str, frozenset]:
+        runtime = self.config.runtime
+        configured_mode = getattr(runtime, "canonical_contract_mode", "warn")
+        configured = getattr(runtime, "canonical_contract_domains", None)
+        stamp = (id(runtime), configured_mode, id(configured))
+        if self._contract_cache is not None and self._contract_cache[0] == stamp:
+            return self._contract_cache[1]
+
+        mode = str(configured_mode or "warn").strip().lower()
+        if mode not in {"off", "warn", "strict"}:
+            mode = "warn"
+        domains = frozenset()
         if isinstance(configured, list):
-            domains = {str(value).strip().lower() for value in configured if str(value).strip()}
-            if domains:
-                return domains
-        return {"weather", "market", "odds", "injury_news", "nextgenstats"}
+            domains = frozenset(str(value).strip().lower() for value in configured if str(value).strip())
+        if not domains:
+            domains = frozenset({"weather", "market", "odds", "injury_news", "nextgenstats"})
+
+        self._contract_cache = (stamp, (mode, domains))
+        return mode, domains
 
     def _normalize_feed_payload(self, feed_name: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         normalized = _as_dict(payload)
@@ -621,12 +1143,12 @@ class CompositeSignalProvider:
         if self._is_unavailable_payload(normalized):
             return normalized
 
-        mode = self._contract_mode()
+        mode, domains = self._contract_settings()
         if mode == "off":
             return normalized
 
         domain = str(feed_name).strip().lower()
-        if domain not in self._contract_domains():
+        if domain not in domains:
             return normalized
 
         errors = validate_canonical_feed(domain, normalized)
@@ -649,484 +1171,397 @@ class CompositeSignalProvider:
             raise RuntimeError(f"{feed_name}_contract_invalid: {','.join(errors[:5])}")
         return normalized
 
+    async def _fetch_all_feeds_async(
+        self, league: Any, week: int, misses: List[Tuple[str, Tuple[str, int, int, int]]]
+    ) -> List[Any]:
+        return await asyncio.gather(
+            *(self._load_feed_async(feed_name, key, league, week) for feed_name, key in misses),
+            return_exceptions=True,
+        )
+
+    def _use_async_fetch(self, feed_names: List[str]) -> bool:
+        if not any(callable(getattr(self._feeds[feed_name], "fetch_async", None)) for feed_name in feed_names):
+            return False
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return True
+        # Already inside an event loop (e.g. a notebook); asyncio.run would fail there.
+        return False
+
+    def _get_feed_pool(self) -> ThreadPoolExecutor:
+        with self._cache_lock:
+            if self._feed_pool is None:
+                self._feed_pool = ThreadPoolExecutor(max_workers=len(self._feeds.names), thread_name_prefix="alpha-feed")
+            return self._feed_pool
+
     def _fetch_all_feeds(self, league: Any, week: int) -> Tuple[Dict[str, Any], List[str]]:
-        payloads: Dict[str, Any] = {}
-        warnings: List[str] = []
+        league_key = _league_key(league, week)
+        ttl = self._cache_ttl()
+        outcomes: List[Tuple[str, Any]] = []
+        misses: List[Tuple[str, Tuple[str, int, int, int]]] = []
+        for feed_name in self._feeds.names:
+            key = (feed_name,) + league_key
+            cached = self._cache_get(self._feed_cache, key, ttl)
+            if cached is None:
+                misses.append((feed_name, key))
+            else:
+                outcomes.append((feed_name, cached))
 
-        with ThreadPoolExecutor(max_workers=len(self._feeds)) as pool:
+        if misses and self._use_async_fetch([feed_name for feed_name, _ in misses]):
+            results = asyncio.run(self._fetch_all_feeds_async(league, week, misses))
+            outcomes.extend((feed_name, result) for (feed_name, _), result in zip(misses, results))
+        elif misses:
+            pool = self._get_feed_pool()
             future_map = {
-                pool.submit(self._fetch_feed, feed_name, league, week): feed_name
-                for feed_name in self._feeds
+                pool.submit(self._load_feed, feed_name, key, league, week): feed_name for feed_name, key in misses
             }
-            for future in as_completed(future_map):
-                feed_name = future_map[future]
-                try:
-                    payload = future.result()
-                except Exception as exc:
-                    if not bool(getattr(self.config.runtime, "degrade_gracefully", True)):
-                        raise RuntimeError(f"{feed_name}_fetch_failed: {exc}") from exc
-                    payload = {
-                        "data": {},
-                        "quality_flags": ["fetch_failed"],
-                        "warnings": [f"{feed_name}_fetch_failed: {exc}"],
-                        "source_timestamp": "",
-                    }
-                payloads[feed_name] = payload
-                warnings.extend(_as_dict(payload).get("warnings", []))
-
-        return payloads, warnings
-
-    def _build_week_payload(self, league: Any, week: int) -> Dict[str, Any]:
-        teams = list(getattr(league, "teams", []) or [])
-        reg_games = max(1, int(getattr(getattr(league, "settings", None), "reg_season_count", 14) or 14))
-        use_extended_signals = bool(getattr(self.config, "enable_extended_signals", False))
-        active_signal_names = list(BASE_SIGNAL_NAMES)
-        if use_extended_signals:
-            active_signal_names.extend(EXTENDED_SIGNAL_NAMES)
-
-        weights = asdict(self.config.weights)
-        positive_weights = {
-            name: max(0.0, _safe_float(weights.get(name, 0.0), 0.0))
-            for name in active_signal_names
-        }
-        weight_sum = sum(positive_weights.values())
-        if weight_sum <= 0:
-            equal = 1.0 / max(1, len(positive_weights))
-            positive_weights = {name: equal for name in positive_weights}
-        else:
-            positive_weights = {name: value / weight_sum for name, value in positive_weights.items()}
+            wait(future_map, return_when=ALL_COMPLETED)
+            for future, feed_name in future_map.items():
+                exc = future.exception()
+                outcomes.append((feed_name, exc if exc is not None else future.result()))
 
-        caps: SignalCaps = self.config.caps
-        cap_map = {
-            "projection_residual": caps.projection_residual,
-            "usage_trend": caps.usage_trend,
-            "injury_opportunity": caps.injury_opportunity,
-            "matchup_unit": caps.matchup_unit,
-            "game_script": caps.game_script,
-            "volatility_aware": caps.volatility_aware,
-            "weather_venue": caps.weather_venue,
-            "market_sentiment_contrarian": caps.market_sentiment_contrarian,
-            "waiver_replacement_value": caps.waiver_replacement_value,
-            "short_term_schedule_cluster": caps.short_term_schedule_cluster,
-        }
-        if use_extended_signals:
-            cap_map.update(
-                {
-                    "player_tilt_leverage": caps.player_tilt_leverage,
-                    "vegas_props": caps.vegas_props,
-                    "win_probability_script": caps.win_probability_script,
-                    "backup_quality_adjustment": caps.backup_quality_adjustment,
-                    "red_zone_opportunity": caps.red_zone_opportunity,
-                    "snap_count_percentage": caps.snap_count_percentage,
-                    "line_movement": caps.line_movement,
+        failed_ttl = max(0, int(getattr(self.config.runtime, "failed_fetch_cache_ttl_seconds", 30) or 0))
+        payloads: Dict[str, Any] = {}
+        warnings: List[str] = []
+        for feed_name, payload in outcomes:
+            if isinstance(payload, BaseException):
+                if not isinstance(payload, Exception):
+                    raise payload
+                if not bool(getattr(self.config.runtime, "degrade_gracefully", True)):
+                    raise RuntimeError(f"{feed_name}_fetch_failed: {payload}") from payload
+                payload = {
+                    "data": {},
+                    "quality_flags": ["fetch_failed"],
+                    "warnings": [f"{feed_name}_fetch_failed: {payload}"],
+                    "source_timestamp": "",
                 }
-            )
+                if failed_ttl > 0:
+                    key = (feed_name,) + league_key
+                    self._cache_put(self._feed_cache, key, payload, expires_in=min(failed_ttl, ttl))
+            payloads[feed_name] = payload
+            warnings.extend(_as_dict(payload).get("warnings", []))
 
-        feeds, feed_warnings = self._fetch_all_feeds(league, week)
-        weather_data = _as_dict(_as_dict(feeds.get("weather", {})).get("data", {}))
-        market_data = _as_dict(_as_dict(feeds.get("market", {})).get("data", {}))
-        odds_data = _as_dict(_as_dict(feeds.get("odds", {})).get("data", {}))
-        injury_data = _as_dict(_as_dict(feeds.get("injury_news", {})).get("data", {}))
-        nextgen_data = _as_dict(_as_dict(feeds.get("nextgenstats", {})).get("data", {}))
-
-        market_projections = _as_dict(market_data.get("projections", {}))
-        usage_trend_map = _as_dict(market_data.get("usage_trend", {}))
-        sentiment_map = _as_dict(market_data.get("sentiment", {}))
-        market_schedule = _as_dict(market_data.get("future_schedule_strength", {}))
-        ownership_by_player = _as_dict(market_data.get("ownership_by_player", {}))
-
-        defense_vs_position = _as_dict(odds_data.get("defense_vs_position", {}))
-        spread_by_team = _as_dict(odds_data.get("spread_by_team", {}))
-        implied_total_by_team = _as_dict(odds_data.get("implied_total_by_team", {}))
-        odds_schedule = _as_dict(odds_data.get("schedule_strength_by_team", {}))
-        player_props_by_player = _as_dict(odds_data.get("player_props_by_player", {}))
-        win_probability_by_team = _as_dict(odds_data.get("win_probability_by_team", {}))
-        live_game_state_by_team = _as_dict(odds_data.get("live_game_state_by_team", {}))
-        opening_spread_by_team = _as_dict(odds_data.get("opening_spread_by_team", {}))
-        closing_spread_by_team = _as_dict(odds_data.get("closing_spread_by_team", {}))
-
-        team_weather = _as_dict(weather_data.get("team_weather", {}))
-        injury_status_map = _as_dict(injury_data.get("injury_status", {}))
-        team_injuries_by_position = _as_dict(injury_data.get("team_injuries_by_position", {}))
-        backup_projection_ratio_by_player = _as_dict(injury_data.get("backup_projection_ratio_by_player", {}))
-        nextgen_player_metrics = _as_dict(nextgen_data.get("player_metrics", {}))
-
-        team_map = {_team_id(team): team for team in teams if _team_id(team) is not None}
-
-        players_by_team: Dict[int, List[Any]] = {}
+        return payloads, warnings
+
+    def _gather_player_frame(
+        self, teams: List[Any], feeds: Dict[str, Any], week: int, reg_games: int, use_extended_signals: bool
+    ) -> Tuple[Dict[str, np.ndarray], List[Tuple[int, Any, str, str, str, Dict[Any, Any]]], Dict[Any, str]]:
+        weather_data = _unpack(feeds.get("weather"))
+        market_data = _unpack(feeds.get("market"))
+        odds_data = _unpack(feeds.get("odds"))
+        injury_data = _unpack(feeds.get("injury_news"))
+        nextgen_data = _unpack(feeds.get("nextgenstats"))
+
+        market_projections = _index_by_key(market_data.get("projections"))
+        usage_trend_map = _index_by_key(market_data.get("usage_trend"))
+        sentiment_map = _index_by_key(market_data.get("sentiment"))
+        market_schedule = _index_by_key(market_data.get("future_schedule_strength"))
+        ownership_by_player = _index_by_key(market_data.get("ownership_by_player"))
+
+        defense_vs_position = _index_by_key(odds_data.get("defense_vs_position"))
+        spread_by_team = _index_by_key(odds_data.get("spread_by_team"))
+        implied_total_by_team = _index_by_key(odds_data.get("implied_total_by_team"))
+        odds_schedule = _index_by_key(odds_data.get("schedule_strength_by_team"))
+        player_props_by_player = _index_by_key(odds_data.get("player_props_by_player"))
+        win_probability_by_team = _index_by_key(odds_data.get("win_probability_by_team"))
+        live_game_state_by_team = _index_by_key(odds_data.get("live_game_state_by_team"))
+        opening_spread_by_team = _index_by_key(odds_data.get("opening_spread_by_team"))
+        closing_spread_by_team = _index_by_key(odds_data.get("closing_spread_by_team"))
+
+        team_weather = _index_by_key(weather_data.get("team_weather"))
+        injury_status_map = _index_by_key(injury_data.get("injury_status"))
+        team_injuries_by_position = _index_by_key(injury_data.get("team_injuries_by_position"))
+        backup_projection_ratio_by_player = _index_by_key(injury_data.get("backup_projection_ratio_by_player"))
+        nextgen_player_metrics = _index_by_key(nextgen_data.get("player_metrics"))
+
+        team_map: Dict[int, Any] = {}
         for team in teams:
             team_id = _team_id(team)
-            if team_id is None:
-                continue
-            players_by_team[team_id] = list(getattr(team, "roster", []) or [])
+            if team_id is not None:
+                team_map[team_id] = team
 
         position_values: Dict[str, List[float]] = {}
-        team_starters: Dict[int, Dict[str, float]] = {}
-        roster_status: Dict[Any, str] = {}
-        injury_overrides: Dict[Any, str] = {}
-        player_ownership: Dict[Any, float] = {}
         ownership_by_position: Dict[str, List[float]] = {}
+        injury_overrides: Dict[Any, str] = {}
+
+        base_rows: List[Tuple[Any, ...]] = []
+        recent_rows: List[List[float]] = []
+        extended_rows: List[Tuple[Any, ...]] = []
+        positions: List[str] = []
+        teammate_out: List[int] = []
+        starters: List[Optional[float]] = []
+        player_meta: List[Tuple[int, Any, str, str, str, Dict[Any, Any]]] = []
+
+        horizon = max(1, int(self.config.schedule_horizon_weeks))
+        for team_id, team in team_map.items():
+            opponent_id = None
+            schedule = list(getattr(team, "schedule", []) or [])
+            if 0 < week <= len(schedule):
+                opponent_id = _team_id(schedule[week - 1])
+            dvp_map = _as_dict(defense_vs_position.get(opponent_id, {}))
+
+            spread = _safe_float(spread_by_team.get(team_id, 0.0), 0.0)
+            implied_total = _safe_float(implied_total_by_team.get(team_id, 22.0), 22.0)
+            weather_info = _as_dict(team_weather.get(team_id, {}))
+            is_dome = bool(weather_info.get("is_dome", False))
+            wind_mph = _safe_float(weather_info.get("wind_mph", 0.0), 0.0)
+            precip_prob = _safe_float(weather_info.get("precip_prob", 0.0), 0.0)
+
+            schedule_data = odds_schedule.get(team_id)
+            if schedule_data is None:
+                schedule_data = market_schedule.get(team_id)
+            if isinstance(schedule_data, list):
+                selected = [_safe_float(item, 0.0) for item in schedule_data[:horizon]]
+                schedule_strength = float(np.mean(selected)) if selected else 0.0
+            else:
+                schedule_strength = _safe_float(schedule_data, 0.0)
+
+            team_extended: Tuple[Any, ...] = ()
+            if use_extended_signals:
+                game_state = _as_dict(live_game_state_by_team.get(team_id, {}))
+                quarter = int(_safe_float(game_state.get("quarter", 0), 0.0))
+                win_prob_input = win_probability_by_team.get(team_id)
+                opening_spread = opening_spread_by_team.get(team_id)
+                opening_spread = _safe_float(spread if opening_spread is None else opening_spread, spread)
+                closing_spread = closing_spread_by_team.get(team_id)
+                closing_spread = _safe_float(spread if closing_spread is None else closing_spread, spread)
+                spread_move = closing_spread - opening_spread
+                live_weight = _cap((quarter - 1) / 3.0, (0.0, 1.0))
+                if quarter >= 4:
+                    time_remaining_sec = _safe_float(game_state.get("time_remaining_sec", 900.0), 900.0)
+                    late_clock_weight = 1.0 - _cap(time_remaining_sec, (0.0, 900.0)) / 900.0
+                    live_weight = _cap(live_weight + (0.5 * late_clock_weight), (0.0, 1.0))
+                score_differential = _safe_float(game_state.get("score_differential", 0.0), 0.0)
+                team_extended = (
+                    live_weight,
+                    _cap(score_differential / 14.0, (-1.5, 1.5)),
+                    win_prob_input is not None or quarter > 0,
+                    0.5 if win_prob_input is None else _cap(_safe_float(win_prob_input, 0.5), (0.0, 1.0)),
+                    1.0 if spread_move < 0 else -1.0,
+                    _cap(abs(spread_move), (0.0, 4.0)),
+                )
 
-        for team_id, roster in players_by_team.items():
             starter_map: Dict[str, float] = {}
-            for player in roster:
+            injured_counts: Dict[str, int] = {}
+            for pos, value in _as_dict(team_injuries_by_position.get(team_id)).items():
+                injured_counts[str(pos).upper()] = max(0, int(_safe_float(value, 0.0)))
+
+            first_row = len(positions)
+            for player in list(getattr(team, "roster", []) or []):
                 pid = _player_id(player)
+                pid_key = _canonical_key(pid)
                 pos = _position(player)
                 baseline = _player_baseline(player, reg_games)
+                started_pct = _safe_float(getattr(player, "percent_started", 50.0), 50.0)
                 if pos:
                     position_values.setdefault(pos, []).append(baseline)
                     starter_map[pos] = max(starter_map.get(pos, 0.0), baseline)
 
-                external_status = _lookup(injury_status_map, pid)
+                external_status = injury_status_map.get(pid_key)
                 if external_status is None:
                     external_status = getattr(player, "injuryStatus", "NONE")
                 status = _normalize_status(external_status)
-                roster_status[pid] = status
                 if status not in HEALTHY_STATUSES:
                     injury_overrides[pid] = status
+                if status in OUTLIKE_STATUSES:
+                    injured_counts[pos] = injured_counts.get(pos, 0) + 1
 
-                ownership_value = _lookup(ownership_by_player, pid)
+                ownership_value = ownership_by_player.get(pid_key)
                 if ownership_value is None:
-                    ownership_value = _safe_float(getattr(player, "percent_started", 50.0), 50.0) / 100.0
-                ownership_value = float(np.clip(_safe_float(ownership_value, 0.5), 0.0, 1.0))
-                player_ownership[pid] = ownership_value
+                    ownership_value = started_pct / 100.0
+                ownership_value = _cap(_safe_float(ownership_value, 0.5), (0.0, 1.0))
                 if pos:
                     ownership_by_position.setdefault(pos, []).append(ownership_value)
 
-            team_starters[team_id] = starter_map
-
-        replacement_by_position = {}
-        for pos, values in position_values.items():
-            if not values:
-                replacement_by_position[pos] = 0.0
-            else:
-                replacement_by_position[pos] = float(np.percentile(np.array(values, dtype=float), 35))
-
-        mean_ownership_by_position: Dict[str, float] = {}
-        for pos, values in ownership_by_position.items():
-            mean_ownership_by_position[pos] = float(np.mean(values)) if values else 0.5
-
-        injured_counts: Dict[int, Dict[str, int]] = {}
-        for team_id, roster in players_by_team.items():
-            counts = {}
-            external_team_counts = _as_dict(_lookup(team_injuries_by_position, team_id, {}))
-            for pos, value in external_team_counts.items():
-                counts[str(pos).upper()] = max(0, int(_safe_float(value, 0.0)))
+                recent_points = _player_recent_points(player, week)[:6]
+                recent_rows.append(recent_points + [0.0] * (6 - len(recent_points)))
+                nextgen_metrics = _as_dict(nextgen_player_metrics.get(pid_key, {}))
 
-            for player in roster:
-                pid = _player_id(player)
-                pos = _position(player)
-                status = roster_status.get(pid, "NONE")
-                if status in OUTLIKE_STATUSES:
-                    counts[pos] = counts.get(pos, 0) + 1
-            injured_counts[team_id] = counts
-
-        player_adjustments: Dict[Any, float] = {}
-        matchup_overrides: Dict[Any, float] = {}
-        diagnostics: Dict[Any, Dict[str, Any]] = {}
-
-        total_players = 0
-        non_zero_adjustments = 0
-
-        for team_id, roster in players_by_team.items():
-            for player in roster:
-                total_players += 1
-                pid = _player_id(player)
-                pos = _position(player)
-                baseline = _player_baseline(player, reg_games)
-                recent_points = _player_recent_points(player, week)
-                recent_window = recent_points[:3]
-                older_window = recent_points[3:6]
-                recent_avg = float(np.mean(recent_window)) if recent_window else baseline
-                older_avg = float(np.mean(older_window)) if older_window else baseline
-                volatility = float(np.std(np.array(recent_points[:6], dtype=float), ddof=1)) if len(recent_points) >= 2 else max(2.0, baseline * 0.2)
-
-                status = roster_status.get(pid, "NONE")
-                nextgen_metrics = _as_dict(_lookup(nextgen_player_metrics, pid, {}))
-                ng_usage_over_expected = _safe_float(nextgen_metrics.get("usage_over_expected", 0.0), 0.0)
-                ng_route_participation = _safe_float(nextgen_metrics.get("route_participation", 0.0), 0.0)
-                ng_avg_separation = _safe_float(nextgen_metrics.get("avg_separation", 0.0), 0.0)
-                ng_explosive_play_rate = _safe_float(nextgen_metrics.get("explosive_play_rate", 0.0), 0.0)
-                ng_volatility_index = _safe_float(nextgen_metrics.get("volatility_index", volatility), volatility)
-                opponent_id = None
-                team_obj = team_map.get(team_id)
-                if team_obj is not None:
-                    schedule = list(getattr(team_obj, "schedule", []) or [])
-                    if 0 < week <= len(schedule):
-                        opponent_id = _team_id(schedule[week - 1])
-
-                external_projection = _lookup(market_projections, pid)
+                external_projection = market_projections.get(pid_key)
                 residual = 0.0
                 if external_projection is not None:
                     residual = _safe_float(external_projection, baseline) - baseline
-                projection_residual = self.config.residual_scale * residual
-                projection_residual += 0.20 * ng_explosive_play_rate
-                projection_residual += 0.10 * ng_avg_separation
-
-                usage_value = _lookup(usage_trend_map, pid)
-                if usage_value is None:
-                    usage_value = recent_avg - older_avg
-                usage_value = _safe_float(usage_value, 0.0) + (0.30 * ng_usage_over_expected)
-                if pos in {"WR", "TE"}:
-                    usage_value += 0.12 * ng_route_participation
-                usage_scale = {
-                    "RB": 1.15,
-                    "WR": 1.10,
-                    "TE": 0.90,
-                    "QB": 0.85,
-                    "K": 0.40,
-                    "D/ST": 0.40,
-                }.get(pos, 1.0)
-                usage_trend = self.config.usage_scale * usage_value * usage_scale
-
-                injury_component = {
-                    "OUT": -3.0,
-                    "IR": -3.0,
-                    "DOUBTFUL": -1.8,
-                    "QUESTIONABLE": -0.8,
-                    "P": -0.4,
-                    "SUSPENSION": -2.5,
-                }.get(status, 0.0)
-                teammate_out = max(0, injured_counts.get(team_id, {}).get(pos, 0))
-                if status in OUTLIKE_STATUSES:
-                    teammate_out = max(0, teammate_out - 1)
-                if status in HEALTHY_STATUSES and teammate_out > 0:
-                    injury_component += 0.8 * teammate_out
-
-                dvp_map = _as_dict(_lookup(defense_vs_position, opponent_id, {}))
-                dvp = _safe_float(_lookup(dvp_map, pos, 0.0), 0.0)
-                matchup_unit = 0.2 * dvp
-                matchup_signal_multiplier = _cap(1.0 + (0.025 * dvp), caps.matchup_signal_multiplier)
-
-                spread = _safe_float(_lookup(spread_by_team, team_id, 0.0), 0.0)
-                implied_total = _safe_float(_lookup(implied_total_by_team, team_id, 22.0), 22.0)
-                favorite = spread < 0
-                if pos in {"QB", "WR", "TE"}:
-                    script_base = -0.30 if favorite else 0.35
-                elif pos == "RB":
-                    script_base = 0.40 if favorite else -0.25
-                else:
-                    script_base = 0.05
-                game_script = script_base + (0.08 * ((implied_total - 22.0) / 3.0))
-
-                volatility_proxy = max(0.0, (0.55 * volatility) + (0.45 * ng_volatility_index))
-                volatility_aware = (-0.08 * volatility_proxy) + (0.25 if volatility_proxy < 4.0 else 0.0)
-
-                weather_info = _as_dict(_lookup(team_weather, team_id, {}))
-                is_dome = bool(weather_info.get("is_dome", False))
-                wind_mph = _safe_float(weather_info.get("wind_mph", 0.0), 0.0)
-                precip_prob = _safe_float(weather_info.get("precip_prob", 0.0), 0.0)
-                weather_venue = 0.0
-                if is_dome:
-                    weather_venue += 0.15 if pos in {"QB", "WR", "TE"} else 0.05
-                else:
-                    if wind_mph >= 15:
-                        weather_venue -= 0.5 if pos in {"QB", "WR", "TE", "K"} else 0.1
-                    if wind_mph >= 22:
-                        weather_venue -= 0.4 if pos in {"QB", "WR", "TE", "K"} else 0.1
-                    if precip_prob >= 0.4:
-                        weather_venue -= 0.4 if pos in {"QB", "WR", "TE", "K"} else 0.05
-
-                sentiment_payload = _lookup(sentiment_map, pid, 0.0)
+
+                usage_value = usage_trend_map.get(pid_key)
+                ng_volatility_index = _safe_float(nextgen_metrics.get("volatility_index"), None)
+
+                sentiment_payload = sentiment_map.get(pid_key, 0.0)
                 if isinstance(sentiment_payload, dict):
                     sentiment_score = _safe_float(sentiment_payload.get("score", 0.0), 0.0)
                     start_delta = _safe_float(sentiment_payload.get("start_delta", 0.0), 0.0)
                 else:
                     sentiment_score = _safe_float(sentiment_payload, 0.0)
                     start_delta = 0.0
-                started_pct = _safe_float(getattr(player, "percent_started", 50.0), 50.0)
-                market_sentiment_contrarian = -0.5 * sentiment_score
-                if started_pct >= 75 and residual < 0:
-                    market_sentiment_contrarian -= min(1.0, abs(residual) * 0.12)
-                if started_pct <= 40 and residual > 0:
-                    market_sentiment_contrarian += min(1.0, residual * 0.12)
-                market_sentiment_contrarian -= 0.10 * start_delta
-
-                replacement_value = _safe_float(_lookup(replacement_by_position, pos, baseline), baseline)
-                starter_value = _safe_float(_lookup(team_starters.get(team_id, {}), pos, replacement_value), replacement_value)
-                waiver_replacement_value = (0.03 * (baseline - replacement_value)) + (0.08 * (baseline - starter_value))
-
-                schedule_data = _lookup(odds_schedule, team_id)
-                if schedule_data is None:
-                    schedule_data = _lookup(market_schedule, team_id)
-                if isinstance(schedule_data, list):
-                    horizon = max(1, int(self.config.schedule_horizon_weeks))
-                    selected = [_safe_float(item, 0.0) for item in schedule_data[:horizon]]
-                    schedule_strength = float(np.mean(selected)) if selected else 0.0
-                else:
-                    schedule_strength = _safe_float(schedule_data, 0.0)
-                short_term_schedule_cluster = (0.25 * schedule_strength) + (0.05 * dvp)
-
-                raw_signals = {
-                    "projection_residual": projection_residual,
-                    "usage_trend": usage_trend,
-                    "injury_opportunity": injury_component,
-                    "matchup_unit": matchup_unit,
-                    "game_script": game_script,
-                    "volatility_aware": volatility_aware,
-                    "weather_venue": weather_venue,
-                    "market_sentiment_contrarian": market_sentiment_contrarian,
-                    "waiver_replacement_value": waiver_replacement_value,
-                    "short_term_schedule_cluster": short_term_schedule_cluster,
-                }
+
+                base_rows.append(
+                    (
+                        POSITION_INDEX.get(pos, OTHER_POSITION_INDEX),
+                        baseline,
+                        residual,
+                        usage_value is not None,
+                        _safe_float(usage_value, 0.0),
+                        _safe_float(nextgen_metrics.get("usage_over_expected", 0.0), 0.0),
+                        _safe_float(nextgen_metrics.get("route_participation", 0.0), 0.0),
+                        _safe_float(nextgen_metrics.get("avg_separation", 0.0), 0.0),
+                        _safe_float(nextgen_metrics.get("explosive_play_rate", 0.0), 0.0),
+                        ng_volatility_index is not None,
+                        0.0 if ng_volatility_index is None else ng_volatility_index,
+                        len(recent_points),
+                        STATUS_INDEX.get(status, OTHER_STATUS_INDEX),
+                        _safe_float(dvp_map.get(pos, 0.0), 0.0),
+                        spread,
+                        implied_total,
+                        is_dome,
+                        wind_mph,
+                        precip_prob,
+                        started_pct,
+                        sentiment_score,
+                        start_delta,
+                        schedule_strength,
+                    )
+                )
                 if use_extended_signals:
-                    ownership_value = player_ownership.get(pid, 0.5)
-                    position_ownership_baseline = mean_ownership_by_position.get(pos, ownership_value)
-                    ownership_delta = position_ownership_baseline - ownership_value
-                    residual_denom = max(2.0, baseline * 0.35)
-                    residual_z_score = float(np.clip(residual / residual_denom, -2.5, 2.5))
-                    player_tilt_leverage = 2.0 * ownership_delta * residual_z_score
-
-                    props = _as_dict(_lookup(player_props_by_player, pid, {}))
-                    vegas_props = 0.0
-                    if props:
-                        line_open = _safe_float(props.get("line_open", baseline), baseline)
-                        line_current = _safe_float(props.get("line_current", line_open), line_open)
-                        sharp_over_pct = float(np.clip(_safe_float(props.get("sharp_over_pct", 0.5), 0.5), 0.0, 1.0))
-                        line_edge = (line_current - baseline) / max(5.0, abs(baseline))
-                        line_move = (line_current - line_open) / max(3.0, abs(line_open))
-                        vegas_props = (3.0 * line_edge) + (1.8 * line_move) + (1.5 * (sharp_over_pct - 0.5))
-
-                    game_state = _as_dict(_lookup(live_game_state_by_team, team_id, {}))
-                    quarter = int(_safe_float(game_state.get("quarter", 0), 0.0))
-                    time_remaining_sec = _safe_float(game_state.get("time_remaining_sec", 900.0), 900.0)
-                    score_differential = _safe_float(game_state.get("score_differential", 0.0), 0.0)
-                    win_prob_input = _lookup(win_probability_by_team, team_id)
-                    has_live_context = quarter > 0
-                    win_probability_script = 0.0
-                    if win_prob_input is not None or has_live_context:
-                        if win_prob_input is None:
-                            team_win_prob = 0.5
-                        else:
-                            team_win_prob = float(np.clip(_safe_float(win_prob_input, 0.5), 0.0, 1.0))
-                        live_weight = float(np.clip((quarter - 1) / 3.0, 0.0, 1.0))
-                        if quarter >= 4:
-                            late_clock_weight = 1.0 - float(np.clip(time_remaining_sec, 0.0, 900.0)) / 900.0
-                            live_weight = float(np.clip(live_weight + (0.5 * late_clock_weight), 0.0, 1.0))
-                        score_pressure = float(np.clip(score_differential / 14.0, -1.5, 1.5))
-                        wp_position_weight = {
-                            "QB": -1.0,
-                            "WR": -0.85,
-                            "TE": -0.60,
-                            "RB": 0.95,
-                            "K": 0.20,
-                            "D/ST": 0.25,
-                        }.get(pos, 0.0)
-                        win_probability_script = (
-                            1.8 * (team_win_prob - 0.5) * wp_position_weight
-                        ) + (
-                            0.7 * live_weight * score_pressure * wp_position_weight
+                    props = _as_dict(player_props_by_player.get(pid_key, {}))
+                    line_open = _safe_float(props.get("line_open", baseline), baseline)
+                    extended_rows.append(
+                        (
+                            ownership_value,
+                            bool(props),
+                            line_open,
+                            _safe_float(props.get("line_current", line_open), line_open),
+                            _safe_float(props.get("sharp_over_pct", 0.5), 0.5),
+                            _safe_float(backup_projection_ratio_by_player.get(pid_key, -1.0), -1.0),
+                            _safe_float(nextgen_metrics.get("red_zone_touch_share", 0.0), 0.0),
+                            _safe_float(nextgen_metrics.get("red_zone_touch_trend", 0.0), 0.0),
+                            "snap_share" in nextgen_metrics or "snap_share_trend" in nextgen_metrics,
+                            _safe_float(nextgen_metrics.get("snap_share", 0.0), 0.0),
+                            _safe_float(nextgen_metrics.get("snap_share_trend", 0.0), 0.0),
                         )
-
-                    backup_ratio = _safe_float(_lookup(backup_projection_ratio_by_player, pid, -1.0), -1.0)
-                    backup_quality_adjustment = 0.0
-                    if backup_ratio >= 0.0:
-                        backup_weight = {
-                            "QB": 1.0,
-                            "RB": 0.4,
-                            "WR": 0.2,
-                            "TE": 0.3,
-                            "K": 0.1,
-                            "D/ST": 0.15,
-                        }.get(pos, 0.0)
-                        if backup_ratio < 0.40:
-                            backup_quality_adjustment = 0.15 * backup_weight
-                        elif backup_ratio > 0.80:
-                            backup_quality_adjustment = -0.10 * backup_weight
-
-                    red_zone_touch_share = float(np.clip(_safe_float(nextgen_metrics.get("red_zone_touch_share", 0.0), 0.0), 0.0, 1.0))
-                    red_zone_touch_trend = float(np.clip(_safe_float(nextgen_metrics.get("red_zone_touch_trend", 0.0), 0.0), -1.0, 1.0))
-                    red_zone_opportunity = (0.20 * red_zone_touch_share) + (0.30 * red_zone_touch_trend)
-
-                    snap_count_percentage = 0.0
-                    if "snap_share" in nextgen_metrics or "snap_share_trend" in nextgen_metrics:
-                        snap_share = float(np.clip(_safe_float(nextgen_metrics.get("snap_share", 0.0), 0.0), 0.0, 1.0))
-                        snap_share_trend = float(np.clip(_safe_float(nextgen_metrics.get("snap_share_trend", 0.0), 0.0), -1.0, 1.0))
-                        snap_share_level = float(np.clip((snap_share - 0.50) / 0.30, -1.0, 1.0))
-                        snap_trend_level = float(np.clip(snap_share_trend / 0.10, -1.0, 1.0))
-                        snap_count_percentage = (0.20 * snap_share_level) + (0.30 * snap_trend_level)
-
-                    opening_spread = _safe_float(_lookup(opening_spread_by_team, team_id, spread), spread)
-                    closing_spread = _safe_float(_lookup(closing_spread_by_team, team_id, spread), spread)
-                    spread_move = closing_spread - opening_spread
-                    spread_move_magnitude = float(np.clip(abs(spread_move), 0.0, 4.0))
-                    spread_move_direction = 1.0 if spread_move < 0 else -1.0
-                    line_move_weight = {
-                        "QB": 0.15,
-                        "RB": 0.20,
-                        "WR": 0.15,
-                        "TE": 0.10,
-                        "K": 0.05,
-                        "D/ST": 0.12,
-                    }.get(pos, 0.08)
-                    line_movement = line_move_weight * spread_move_direction * spread_move_magnitude
-
-                    raw_signals.update(
-                        {
-                            "player_tilt_leverage": player_tilt_leverage,
-                            "vegas_props": vegas_props,
-                            "win_probability_script": win_probability_script,
-                            "backup_quality_adjustment": backup_quality_adjustment,
-                            "red_zone_opportunity": red_zone_opportunity,
-                            "snap_count_percentage": snap_count_percentage,
-                            "line_movement": line_movement,
-                        }
+                        + team_extended
                     )
+                positions.append(pos)
+                player_meta.append((team_id, pid, getattr(player, "name", str(pid)), pos, status, nextgen_metrics))
 
-                clipped_signals = {
-                    name: _cap(value, cap_map[name])
-                    for name, value in raw_signals.items()
-                }
+            for pos in positions[first_row:]:
+                teammate_out.append(injured_counts.get(pos, 0))
+                starters.append(starter_map.get(pos))
 
-                weighted_signals = {
-                    name: clipped_signals[name] * positive_weights.get(name, 0.0)
-                    for name in clipped_signals
-                }
+        replacement_by_position = {pos: _percentile(values, 35.0) for pos, values in position_values.items()}
+        mean_ownership_by_position: Dict[str, float] = {}
+        for pos, values in ownership_by_position.items():
+            mean_ownership_by_position[pos] = float(np.mean(values)) if values else 0.5
 
-                weighted_sum = float(sum(weighted_signals.values()))
-                final_adjustment = _cap(weighted_sum, caps.total_adjustment)
-                if abs(final_adjustment) > 1e-9:
-                    non_zero_adjustments += 1
-
-                matchup_multiplier = matchup_signal_multiplier * (1.0 + (0.01 * clipped_signals["short_term_schedule_cluster"]))
-                matchup_multiplier *= 1.0 + np.clip((clipped_signals["weather_venue"] * 0.02), -0.03, 0.03)
-                matchup_multiplier = _cap(matchup_multiplier, caps.matchup_multiplier)
-
-                player_adjustments[pid] = float(final_adjustment)
-                matchup_overrides[pid] = float(matchup_multiplier)
-
-                diagnostics[pid] = {
-                    "player": getattr(player, "name", str(pid)),
-                    "team_id": team_id,
-                    "position": pos,
-                    "nextgen_metrics": nextgen_metrics,
-                    "signals": clipped_signals,
-                    "weighted_signals": weighted_signals,
-                    "weighted_sum": weighted_sum,
-                    "final_adjustment": final_adjustment,
-                    "matchup_multiplier": matchup_multiplier,
-                    "injury_status": status,
-                    "extended_signals_enabled": use_extended_signals,
-                }
+        frame = _frame_columns(base_rows, FRAME_COLUMNS)
+        frame["recent_points"] = np.array(recent_rows, dtype=float).reshape(len(recent_rows), 6)
+        baselines = frame["baseline"].tolist()
+        replacement = [replacement_by_position.get(pos, baseline) for pos, baseline in zip(positions, baselines)]
+        frame["teammate_out"] = np.array(teammate_out, dtype=float)
+        frame["replacement"] = np.array(replacement, dtype=float)
+        frame["starter"] = np.array(
+            [value if starter is None else starter for starter, value in zip(starters, replacement)], dtype=float
+        )
+        if use_extended_signals:
+            frame.update(_frame_columns(extended_rows, EXTENDED_FRAME_COLUMNS))
+            ownership = frame["ownership"].tolist()
+            frame["position_ownership"] = np.array(
+                [mean_ownership_by_position.get(pos, value) for pos, value in zip(positions, ownership)], dtype=float
+            )
+        return frame, player_meta, injury_overrides
+
+    def _build_week_payload(self, league: Any, week: int) -> Dict[str, Any]:
+        teams = list(getattr(league, "teams", []) or [])
+        reg_games = max(1, int(getattr(getattr(league, "settings", None), "reg_season_count", 14) or 14))
+        use_extended_signals = bool(getattr(self.config, "enable_extended_signals", False))
+        active_signal_names, weight_vec, cap_lows, cap_highs = self._signal_plan()
+        caps: SignalCaps = self.config.caps
+
+        feeds, feed_warnings = self._fetch_all_feeds(league, week)
+        frame, player_meta, injury_overrides = self._gather_player_frame(teams, feeds, week, reg_games, use_extended_signals)
+        total_players = len(player_meta)
+        params = {
+            "use_extended_signals": use_extended_signals,
+            "residual_scale": self.config.residual_scale,
+            "usage_scale": self.config.usage_scale,
+            "matchup_signal_cap": tuple(caps.matchup_signal_multiplier),
+        }
+        raw_matrix, signal_multipliers = _compute_signal_matrix(frame, params)
+
+        if getattr(self.config.runtime, "signal_float32", False):
+            raw_matrix = raw_matrix.astype(np.float32)
+            cap_lows, cap_highs, weight_vec = (
+                cap_lows.astype(np.float32),
+                cap_highs.astype(np.float32),
+                weight_vec.astype(np.float32),
+            )
+        signal_matrix = np.clip(raw_matrix, cap_lows, cap_highs)
+        weighted_sums = signal_matrix @ weight_vec
+        final_adjustments = _cap_array(weighted_sums, caps.total_adjustment)
+        schedule_cluster = signal_matrix[:, active_signal_names.index("short_term_schedule_cluster")]
+        weather_venue = signal_matrix[:, active_signal_names.index("weather_venue")]
+        matchup_multipliers = signal_multipliers * (1.0 + (0.01 * schedule_cluster))
+        weather_factor = weather_venue * 0.02
+        np.clip(weather_factor, -0.03, 0.03, out=weather_factor)
+        weather_factor += 1.0
+        matchup_multipliers *= weather_factor
+        matchup_multipliers = _cap_array(matchup_multipliers, caps.matchup_multiplier)
+
+        non_zero_adjustments = int(np.count_nonzero(np.abs(final_adjustments) > 1e-9))
+
+        # A repeated pid maps to its last row, as in the pid-keyed dicts.
+        pids = [meta[1] for meta in player_meta]
+        pid_index = {pid: row_index for row_index, pid in enumerate(pids)}
+        adjustment_rows = final_adjustments.tolist()
+        multiplier_rows = matchup_multipliers.tolist()
+        player_adjustments: Dict[Any, float] = dict(zip(pids, adjustment_rows))
+        matchup_overrides: Dict[Any, float] = dict(zip(pids, multiplier_rows))
+
+        diagnostics: Dict[Any, _PlayerDiagnostic] = {}
+        if getattr(self.config, "collect_diagnostics", True):
+            clipped_rows = signal_matrix.tolist()
+            signal_weights = tuple(weight_vec.tolist())
+            weighted_sums = weighted_sums.tolist()
+            for row_index, (team_id, pid, player_name, pos, status, nextgen_metrics) in enumerate(player_meta):
+                diagnostics[pid] = _PlayerDiagnostic(
+                    player_name,
+                    team_id,
+                    pos,
+                    nextgen_metrics,
+                    active_signal_names,
+                    signal_weights,
+                    clipped_rows[row_index],
+                    weighted_sums[row_index],
+                    adjustment_rows[row_index],
+                    multiplier_rows[row_index],
+                    status,
+                    use_extended_signals,
+                )
 
         quality_flags = set()
+        feeds_unavailable = True
         for feed_name, feed_payload in feeds.items():
             for flag in _as_dict(feed_payload).get("quality_flags", []):
-                quality_flags.add(f"{feed_name}:{flag}")
+                flag = f"{feed_name}:{flag}"
+                quality_flags.add(flag)
+                if feeds_unavailable and "fetch_failed" not in flag and "endpoint_not_configured" not in flag:
+                    feeds_unavailable = False
 
         warnings = list(feed_warnings)
-        feed_flags = [flag for flag in quality_flags if ":" in flag]
-        if feed_flags and all("fetch_failed" in flag or "endpoint_not_configured" in flag for flag in feed_flags):
+        if quality_flags and feeds_unavailable:
             warnings.append("External feeds unavailable; provider degraded to league-only signals")
 
+        adjustment_values = final_adjustments.astype(float, copy=False)
+        if len(pid_index) != total_players:
+            # A repeated pid is counted once (its last row), like the pid-keyed output.
+            adjustment_values = adjustment_values[sorted(pid_index.values())]
+        cap_hits = np.count_nonzero(
+            (adjustment_values <= caps.total_adjustment[0] + 1e-9) | (adjustment_values >= caps.total_adjustment[1] - 1e-9)
+        )
+
         summary = {
             "players_evaluated": total_players,
             "players_with_non_zero_alpha": non_zero_adjustments,
-            "cap_hits_total_adjustment": sum(
-                1
-                for value in player_adjustments.values()
-                if value <= caps.total_adjustment[0] + 1e-9 or value >= caps.total_adjustment[1] - 1e-9
-            ),
+            "cap_hits_total_adjustment": int(cap_hits),
             "quality_flags": sorted(quality_flags),
             "active_signals": list(active_signal_names),
             "extended_signals_enabled": use_extended_signals,
@@ -1136,6 +1571,9 @@ class CompositeSignalProvider:
             "player_adjustments": player_adjustments,
             "injury_overrides": injury_overrides,
             "matchup_overrides": matchup_overrides,
+            "pid_index": pid_index,
+            "player_adjustment_vector": final_adjustments,
+            "matchup_override_vector": matchup_multipliers,
             "diagnostics": diagnostics,
             "warnings": warnings,
             "summary": summary,
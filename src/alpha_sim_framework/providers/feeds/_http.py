@@ -0,0 +1,74 @@
+import json
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+# HTTP statuses worth another attempt; other client errors and malformed bodies fail fast.
+RETRYABLE_HTTP_STATUS = frozenset({429, 500, 502, 503, 504})
+
+class ResponseCache:
+    """Thread-safe ``(stored_at, value)`` entries by request key, evicting the least recently used.
+
+    ``get`` skips entries older than ``ttl`` seconds; with no ``ttl`` it returns an entry of any age.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max(1, int(max_entries))
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, ttl: Optional[float] = None) -> Optional[Tuple[float, Any]]:
+        with self._lock:
+            hit = self._entries.get(key)
+            if hit is None or (ttl is not None and time.monotonic() - hit[0] > ttl):
+                return None
+            self._entries.move_to_end(key)
+            return hit
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+def response_validators(response: Any) -> Tuple[str, str]:
+    headers = getattr(response, "headers", None)
+    if headers is None:
+        return "", ""
+    return str(headers.get("ETag") or ""), str(headers.get("Last-Modified") or "")
+
+
+def get_json(url: str, headers: Dict[str, str], timeout: float, retries: int, backoff: float) -> Tuple[Any, Tuple[str, str]]:
+    """GET ``url`` and decode its JSON body, returning it with the response's ETag/Last-Modified.
+
+    Retryable statuses and network errors are retried with jittered exponential backoff; the last
+    error is re-raised once attempts run out or a non-retryable error occurs.
+    """
+    attempts = max(0, int(retries)) + 1
+    for attempt in range(attempts):
+        try:
+            request = urllib.request.Request(url=url, headers=headers, method="GET")
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                raw = response.read()
+                validators = response_validators(response)
+            return json.loads(raw), validators
+        except Exception as exc:
+            if (
+                attempt + 1 >= attempts
+                or isinstance(exc, ValueError)
+                or (isinstance(exc, urllib.error.HTTPError) and exc.code not in RETRYABLE_HTTP_STATUS)
+            ):
+                raise
+            if backoff > 0:
+                time.sleep(backoff * (2**attempt) * random.uniform(0.5, 1.5))
+    raise RuntimeError("request_failed")
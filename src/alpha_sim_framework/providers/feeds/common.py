@@ -1,26 +1,34 @@
-import json
 import os
 import re
 import time
+import urllib.error
 import urllib.parse
-import urllib.request
-from datetime import datetime, timezone
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 from ...alpha_types import ExternalFeedConfig, ProviderRuntimeConfig
+from ._http import ResponseCache, get_json
 from .free_api import fetch_free_feed
 
 
+_UTC_SECOND: Tuple[int, str] = (-1, "")
+
+
 def _utc_now() -> str:
-    return datetime.now(timezone.utc).isoformat()
+    # Same text as datetime.now(timezone.utc).isoformat(), formatting the date/time once per second.
+    global _UTC_SECOND
+    second, remainder = divmod(time.time_ns(), 1_000_000_000)
+    cached_second, prefix = _UTC_SECOND
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _UTC_SECOND = (second, prefix)
+    micros = remainder // 1000
+    return f"{prefix}.{micros:06d}+00:00" if micros else f"{prefix}+00:00"
 
 
-def _league_params(league: Any, week: int) -> Dict[str, str]:
-    return {
-        "league_id": str(getattr(league, "league_id", "")),
-        "year": str(getattr(league, "year", "")),
-        "week": str(int(week)),
-    }
+def _league_query(league: Any, week: int) -> str:
+    league_id = urllib.parse.quote_plus(str(getattr(league, "league_id", "")))
+    year = urllib.parse.quote_plus(str(getattr(league, "year", "")))
+    return f"league_id={league_id}&year={year}&week={int(week)}"
 
 
 def _normalize_mapping(data: Any) -> Dict[str, Any]:
@@ -33,7 +41,7 @@ _ENV_PATTERN = re.compile(r"\$\{([A-Za-z_][A-Za-z0-9_]*)\}")
 
 
 def _expand_env_string(value: Any) -> Any:
-    if not isinstance(value, str):
+    if not isinstance(value, str) or "${" not in value:
         return value
     return _ENV_PATTERN.sub(lambda match: os.getenv(match.group(1), match.group(0)), value)
 
@@ -46,145 +54,191 @@ def _is_unresolved_placeholder(value: Any) -> bool:
 def _merge_string_list(base: list, extra: Any) -> list:
     if not isinstance(extra, list):
         return base
+    seen = set(base)
     for item in extra:
-        if isinstance(item, str) and item not in base:
+        if isinstance(item, str) and item not in seen:
+            seen.add(item)
             base.append(item)
     return base
 
 
 def _is_feed_envelope(value: Any) -> bool:
-    if not isinstance(value, dict):
-        return False
-    required = {"data", "source_timestamp", "quality_flags", "warnings"}
-    return required.issubset(value.keys())
+    return (
+        isinstance(value, dict)
+        and "data" in value
+        and "source_timestamp" in value
+        and "quality_flags" in value
+        and "warnings" in value
+    )
+
+
+def _coerce_feed_envelope(
+    value: Any, base_quality_flags: Tuple[str, ...] = (), base_warnings: Tuple[str, ...] = ()
+) -> Dict[str, Any]:
+    if _is_feed_envelope(value):
+        data = value.get("data")
+        quality_flags = list(base_quality_flags)
+        if data is None:
+            data = {}
+        elif not isinstance(data, dict):
+            data = {"value": data}
+            quality_flags.append("data_wrapped_value")
 
+        source_timestamp = value.get("source_timestamp")
+        if not (isinstance(source_timestamp, str) and source_timestamp.strip()):
+            source_timestamp = _utc_now()
+
+        return {
+            "data": data,
+            "source_timestamp": source_timestamp,
+            "quality_flags": _merge_string_list(quality_flags, value.get("quality_flags")),
+            "warnings": _merge_string_list(list(base_warnings), value.get("warnings")),
+        }
 
-def _coerce_feed_envelope(value: Any, base_quality_flags: list, base_warnings: list) -> Dict[str, Any]:
-    payload = {
-        "data": {},
+    if isinstance(value, dict):
+        data, flag = value, "raw_payload_wrapped"
+    else:
+        data, flag = {"value": value}, "non_object_payload_wrapped"
+    return {
+        "data": data,
         "source_timestamp": _utc_now(),
-        "quality_flags": list(base_quality_flags),
+        "quality_flags": [*base_quality_flags, flag],
         "warnings": list(base_warnings),
     }
 
-    if _is_feed_envelope(value):
-        data = value.get("data")
-        if isinstance(data, dict):
-            payload["data"] = data
-        elif data is not None:
-            payload["data"] = {"value": data}
-            payload["quality_flags"].append("data_wrapped_value")
 
-        source_timestamp = value.get("source_timestamp")
-        if isinstance(source_timestamp, str) and source_timestamp.strip():
-            payload["source_timestamp"] = source_timestamp
+def _empty_envelope(quality_flag: str, warning: str = "") -> Dict[str, Any]:
+    return {
+        "data": {},
+        "source_timestamp": _utc_now(),
+        "quality_flags": [quality_flag],
+        "warnings": [warning] if warning else [],
+    }
 
-        payload["quality_flags"] = _merge_string_list(payload["quality_flags"], value.get("quality_flags"))
-        payload["warnings"] = _merge_string_list(payload["warnings"], value.get("warnings"))
-        return payload
 
-    if isinstance(value, dict):
-        payload["data"] = value
-        payload["quality_flags"].append("raw_payload_wrapped")
-        return payload
+def _copy_envelope(payload: Dict[str, Any]) -> Dict[str, Any]:
+    # Callers append flags and warnings to the envelope they get back; the data stays shared.
+    copied = dict(payload)
+    copied["quality_flags"] = list(payload.get("quality_flags", []))
+    copied["warnings"] = list(payload.get("warnings", []))
+    return copied
+
 
-    payload["data"] = {"value": value}
-    payload["quality_flags"].append("non_object_payload_wrapped")
-    return payload
+def _resolve_env_value(value: Any) -> Any:
+    resolved = _expand_env_string(value)
+    if _is_unresolved_placeholder(resolved):
+        return None
+    return resolved
 
 
 def _expand_mapping_env(data: Dict[str, Any]) -> Dict[str, Any]:
-    expanded: Dict[str, Any] = {}
-    for key, value in dict(data or {}).items():
-        resolved = _expand_env_string(value)
-        if _is_unresolved_placeholder(resolved):
-            resolved = None
-        expanded[str(key)] = resolved
-    return expanded
+    return {str(key): _resolve_env_value(value) for key, value in _normalize_mapping(data).items()}
 
 
 class JSONFeedClient:
     def __init__(self, feed_name: str, config: ExternalFeedConfig, runtime: ProviderRuntimeConfig):
         self.feed_name = str(feed_name)
+        self._endpoint_env = f"ALPHA_{self.feed_name.upper()}_ENDPOINT"
+        self._api_key_env = f"ALPHA_{self.feed_name.upper()}_API_KEY"
         self.config = config
         self.runtime = runtime
+        self._responses = ResponseCache(self._max_entries())
+        self._free_responses = ResponseCache(self._max_entries())
 
-    def fetch(self, league: Any, week: int) -> Dict[str, Any]:
-        payload = {
-            "data": {},
-            "source_timestamp": _utc_now(),
-            "quality_flags": [],
-            "warnings": [],
+    def _max_entries(self) -> int:
+        return max(1, int(getattr(self.runtime, "cache_max_entries", 256) or 256))
+
+    def _request_headers(self, api_keys: Dict[str, Any]) -> Dict[str, str]:
+        headers = {
+            str(key): str(_expand_env_string(value))
+            for key, value in _normalize_mapping(self.config.request_headers).items()
         }
+        api_key = _resolve_env_value(api_keys.get(self.feed_name))
+        api_key = api_key or os.getenv(self._api_key_env)
+        if api_key and "Authorization" not in headers:
+            headers["Authorization"] = f"Bearer {api_key}"
+        return headers
 
+    def fetch(self, league: Any, week: int) -> Dict[str, Any]:
         if not self.config.enabled:
-            payload["quality_flags"].append("feed_disabled")
-            return payload
+            return _empty_envelope("feed_disabled")
 
         static_payloads = _normalize_mapping(self.config.static_payloads)
         if self.feed_name in static_payloads:
             return _coerce_feed_envelope(
                 static_payloads[self.feed_name],
-                base_quality_flags=["static_payload"],
-                base_warnings=[],
+                base_quality_flags=("static_payload",),
             )
 
-        endpoint_map = _expand_mapping_env(_normalize_mapping(self.config.endpoints))
-        endpoint = endpoint_map.get(self.feed_name)
-        endpoint = endpoint or os.getenv(f"ALPHA_{self.feed_name.upper()}_ENDPOINT")
+        # Placeholders are expanded at fetch time; the environment may change after construction.
+        endpoints = _normalize_mapping(self.config.endpoints)
+        endpoint = _resolve_env_value(endpoints.get(self.feed_name))
+        endpoint = endpoint or os.getenv(self._endpoint_env)
         if not endpoint:
-            payload["quality_flags"].append("endpoint_not_configured")
-            return payload
-
-        headers = {
-            str(key): str(_expand_env_string(value))
-            for key, value in dict(_normalize_mapping(self.config.request_headers)).items()
-        }
-        api_keys = _expand_mapping_env(_normalize_mapping(self.config.api_keys))
-        api_key = api_keys.get(self.feed_name)
-        api_key = api_key or os.getenv(f"ALPHA_{self.feed_name.upper()}_API_KEY")
-        if api_key and "Authorization" not in headers:
-            headers["Authorization"] = f"Bearer {api_key}"
+            return _empty_envelope("endpoint_not_configured")
 
+        raw_api_keys = _normalize_mapping(self.config.api_keys)
         retries = max(0, int(getattr(self.runtime, "retries", 1)))
         timeout = float(getattr(self.runtime, "timeout_seconds", 2.0))
         backoff = float(getattr(self.runtime, "backoff_seconds", 0.2))
+        ttl = max(0, int(getattr(self.runtime, "cache_ttl_seconds", 300)))
 
         if str(endpoint).startswith("free://"):
+            self._free_responses.max_entries = self._max_entries()
             return fetch_free_feed(
                 feed_name=self.feed_name,
                 endpoint=str(endpoint),
-                endpoint_map=endpoint_map,
-                api_keys=api_keys,
-                headers=headers,
+                endpoint_map=_expand_mapping_env(endpoints),
+                api_keys=_expand_mapping_env(raw_api_keys),
+                headers=self._request_headers(raw_api_keys),
                 league=league,
                 week=week,
                 timeout=timeout,
                 retries=retries,
                 backoff=backoff,
+                cache=self._free_responses,
+                cache_ttl=ttl,
             )
 
-        params = _league_params(league, week)
-        query = urllib.parse.urlencode(params)
-        url = f"{endpoint}{'&' if '?' in endpoint else '?'}{query}"
-
-        last_error = ""
-        for attempt in range(retries + 1):
-            try:
-                request = urllib.request.Request(url=url, headers=headers, method="GET")
-                with urllib.request.urlopen(request, timeout=timeout) as response:
-                    raw = response.read().decode("utf-8")
-                value = json.loads(raw)
-                return _coerce_feed_envelope(
-                    value,
-                    base_quality_flags=["live_fetch"],
-                    base_warnings=[],
-                )
-            except Exception as exc:
-                last_error = str(exc)
-                if attempt < retries and backoff > 0:
-                    time.sleep(backoff)
-
-        payload["quality_flags"].append("fetch_failed")
-        payload["warnings"].append(f"{self.feed_name}_fetch_failed: {last_error}")
-        return payload
+        url = f"{endpoint}{'&' if '?' in endpoint else '?'}{_league_query(league, week)}"
+
+        self._responses.max_entries = self._max_entries()
+        cached = self._responses.get(url)
+        if cached is not None:
+            stored_at, (cached_envelope, (etag, last_modified)) = cached
+            if time.monotonic() - stored_at <= ttl:
+                return _copy_envelope(cached_envelope)
+
+        headers = self._request_headers(raw_api_keys)
+        if cached is not None:
+            if etag:
+                headers.setdefault("If-None-Match", etag)
+            if last_modified:
+                headers.setdefault("If-Modified-Since", last_modified)
+        try:
+            value, validators = get_json(url, headers, timeout, retries, backoff)
+        except Exception as exc:
+            if isinstance(exc, urllib.error.HTTPError) and exc.code == 304 and cached is not None:
+                self._responses.put(url, cached[1])
+                revalidated = _copy_envelope(cached_envelope)
+                revalidated["quality_flags"].append("not_modified")
+                return revalidated
+            last_error = str(exc)
+        else:
+            envelope = _coerce_feed_envelope(
+                value,
+                base_quality_flags=("live_fetch",),
+            )
+            if ttl > 0:
+                self._responses.put(url, (envelope, validators))
+                return _copy_envelope(envelope)
+            return envelope
+
+        max_stale_age = max(0, int(getattr(self.runtime, "stale_cache_max_age_seconds", 3600) or 0))
+        if cached is not None and time.monotonic() - stored_at <= max_stale_age:
+            stale = _copy_envelope(cached_envelope)
+            stale["quality_flags"].append("stale_cache_fallback")
+            stale["warnings"].append(f"{self.feed_name}_fetch_failed: {last_error}")
+            return stale
+
+        return _empty_envelope("fetch_failed", f"{self.feed_name}_fetch_failed: {last_error}")
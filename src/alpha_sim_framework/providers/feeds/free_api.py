@@ -1,14 +1,18 @@
-import json
 import math
 import statistics
 import time
 import urllib.parse
-import urllib.request
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 
-OUTLIKE_STATUSES = {"OUT", "DOUBTFUL", "IR", "SUSPENSION", "SUSP", "PUP", "COVID-19"}
+from .._array_ops import clip_array, window_averages
+from ._http import ResponseCache, get_json
+
+
+OUTLIKE_STATUSES = frozenset({"OUT", "DOUBTFUL", "IR", "SUSPENSION", "SUSP", "PUP", "COVID-19"})
 DOME_NFL_TEAMS = {"ATL", "DAL", "DET", "HOU", "IND", "LV", "MIN", "NO"}
 
 DEFAULT_WEATHER_ENDPOINT = "https://api.open-meteo.com/v1/forecast"
@@ -17,12 +21,22 @@ DEFAULT_SLEEPER_ADD_ENDPOINT = "https://api.sleeper.app/v1/players/nfl/trending/
 DEFAULT_SLEEPER_DROP_ENDPOINT = "https://api.sleeper.app/v1/players/nfl/trending/drop?lookback_hours=24&limit=200"
 DEFAULT_ODDS_ENDPOINT = "https://api.the-odds-api.com/v4/sports/americanfootball_nfl/odds?regions=us&markets=h2h,spreads,totals"
 
+# The Sleeper players index changes rarely; when responses are cached it is kept at least this long.
+_PLAYERS_INDEX_TTL_SECONDS = 3600.0
+# Forecasts and lines move within minutes, so those responses are never kept longer than this.
+_WEATHER_TTL_SECONDS = 120.0
+_ODDS_TTL_SECONDS = 30.0
+
 
 def _utc_now() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
 def _safe_float(value: Any, default: float = 0.0) -> float:
+    if type(value) is float:
+        return value
+    if value is None:
+        return default
     try:
         return float(value)
     except Exception:
@@ -30,6 +44,10 @@ def _safe_float(value: Any, default: float = 0.0) -> float:
 
 
 def _safe_int(value: Any, default: int = 0) -> int:
+    if type(value) is int:
+        return value
+    if value is None:
+        return default
     try:
         return int(value)
     except Exception:
@@ -37,7 +55,9 @@ def _safe_int(value: Any, default: int = 0) -> int:
 
 
 def _clip(value: Any, low: float, high: float, default: float = 0.0) -> float:
-    return max(low, min(high, _safe_float(value, default)))
+    if type(value) is not float:
+        value = _safe_float(value, default)
+    return max(low, min(high, value))
 
 
 def _as_dict(value: Any) -> Dict[str, Any]:
@@ -48,15 +68,24 @@ def _as_list(value: Any) -> List[Any]:
     return value if isinstance(value, list) else []
 
 
+_STATUS_ALIASES = {
+    "": "NONE",
+    "NONE": "NONE",
+    "NA": "NONE",
+    "ACTIVE": "NONE",
+    "HEALTHY": "NONE",
+    "PROBABLE": "NONE",
+    "P": "NONE",
+    "Q": "QUESTIONABLE",
+    "D": "DOUBTFUL",
+}
+
+
 def _normalize_status(value: Any) -> str:
-    text = str(value or "").strip().upper()
-    if not text or text in {"NONE", "NA", "ACTIVE", "HEALTHY", "PROBABLE", "P"}:
+    if not value:
         return "NONE"
-    if text == "Q":
-        return "QUESTIONABLE"
-    if text == "D":
-        return "DOUBTFUL"
-    return text
+    text = (value if type(value) is str else str(value)).strip().upper()
+    return _STATUS_ALIASES.get(text, text)
 
 
 def _team_id(team: Any) -> Optional[int]:
@@ -115,11 +144,32 @@ def _player_nfl_team(player: Any) -> str:
     return ""
 
 
-def _top_qb_nfl_team(team: Any) -> str:
-    qbs = [player for player in list(getattr(team, "roster", []) or []) if _player_position(player) == "QB"]
+@dataclass
+class _TeamRoster:
+    team: Any
+    team_id: Optional[int]
+    roster: List[Any]
+    projections: List[float]
+
+
+def _league_rosters(league: Any) -> List[_TeamRoster]:
+    rosters: List[_TeamRoster] = []
+    for team in list(getattr(league, "teams", []) or []):
+        roster = list(getattr(team, "roster", []) or [])
+        rosters.append(_TeamRoster(team, _team_id(team), roster, [_player_projection(player) for player in roster]))
+    return rosters
+
+
+def _top_qb_nfl_team(team: _TeamRoster) -> str:
+    qbs = [
+        (player, projection)
+        for player, projection in zip(team.roster, team.projections)
+        if _player_position(player) == "QB"
+    ]
     if not qbs:
         return ""
-    best = sorted(qbs, key=lambda player: _player_projection(player), reverse=True)[0]
+    # max() keeps the first of equal projections, as the stable descending sort did.
+    best = max(qbs, key=lambda item: item[1])[0]
     return _player_nfl_team(best)
 
 
@@ -130,47 +180,82 @@ def _with_query(url: str, params: Dict[str, Any]) -> str:
     return f"{url}{'&' if '?' in url else '?'}{query}"
 
 
-def _http_get_json(url: str, headers: Dict[str, str], timeout: float, retries: int, backoff: float) -> Any:
-    last_error = ""
-    for attempt in range(max(0, int(retries)) + 1):
+def _weather_url(endpoint: str, lat: float, lon: float) -> str:
+    latitude = urllib.parse.quote_plus(str(lat))
+    longitude = urllib.parse.quote_plus(str(lon))
+    query = (
+        f"latitude={latitude}&longitude={longitude}"
+        "&current=wind_speed_10m%2Cprecipitation_probability&wind_speed_unit=mph&forecast_days=1"
+    )
+    return f"{endpoint}{'&' if '?' in endpoint else '?'}{query}"
+
+
+def _http_get_json(
+    url: str,
+    headers: Dict[str, str],
+    timeout: float,
+    retries: int,
+    backoff: float,
+    cache: Optional[ResponseCache] = None,
+    cache_ttl: float = 0.0,
+) -> Any:
+    # Cached bodies are shared between callers and must be treated as read-only.
+    key = None
+    if cache is not None and cache_ttl > 0:
+        key = (url, tuple(sorted(headers.items())))
+        hit = cache.get(key, cache_ttl)
+        if hit is not None:
+            return hit[1]
+    try:
+        value, _ = get_json(url, headers, timeout, retries, backoff)
+    except Exception as exc:
+        raise RuntimeError(str(exc) or "request_failed") from exc
+    if key is not None:
+        cache.put(key, value)
+    return value
+
+
+def _http_get_json_many(
+    urls: List[str],
+    headers: Dict[str, str],
+    timeout: float,
+    retries: int,
+    backoff: float,
+    cache: Optional[ResponseCache] = None,
+    cache_ttl: float = 0.0,
+) -> List[Tuple[Any, Optional[BaseException]]]:
+    results: List[Tuple[Any, Optional[BaseException]]] = []
+    for url in urls:
         try:
-            request = urllib.request.Request(url=url, headers=headers, method="GET")
-            with urllib.request.urlopen(request, timeout=timeout) as response:
-                raw = response.read().decode("utf-8")
-            return json.loads(raw)
+            results.append((_http_get_json(url, headers, timeout, retries, backoff, cache, cache_ttl), None))
         except Exception as exc:
-            last_error = str(exc)
-            if attempt < retries and backoff > 0:
-                time.sleep(backoff)
-    raise RuntimeError(last_error or "request_failed")
+            results.append((None, exc))
+    return results
 
 
-def _schedule_strengths(teams: List[Any], week: int, horizon: int = 4) -> Dict[str, Any]:
+def _schedule_strengths(teams: List[_TeamRoster], week: int, horizon: int = 4) -> Dict[str, Any]:
     output: Dict[str, Any] = {}
     start_idx = max(0, int(week) - 1)
     denom = max(1.0, float(max(1, week - 1)))
-    for team in teams:
-        team_id = _team_id(team)
-        if team_id is None:
+    for row in teams:
+        if row.team_id is None:
             continue
-        own_wins = _safe_float(getattr(team, "wins", 0), 0.0)
+        own_wins = _safe_float(getattr(row.team, "wins", 0), 0.0)
         values: List[float] = []
-        for opp in list(getattr(team, "schedule", []) or [])[start_idx : start_idx + max(1, horizon)]:
+        for opp in list(getattr(row.team, "schedule", []) or [])[start_idx : start_idx + max(1, horizon)]:
             opp_wins = _safe_float(getattr(opp, "wins", 0), 0.0)
             values.append(round((opp_wins - own_wins) / denom, 3))
-        output[str(team_id)] = values if values else 0.0
+        output[str(row.team_id)] = values if values else 0.0
     return output
 
 
-def _team_projected_totals(teams: List[Any]) -> Dict[str, float]:
+def _team_projected_totals(teams: List[_TeamRoster]) -> Dict[str, float]:
     projected: Dict[str, float] = {}
-    for team in teams:
-        team_id = _team_id(team)
-        if team_id is None:
+    for row in teams:
+        if row.team_id is None:
             continue
-        roster = list(getattr(team, "roster", []) or [])
-        top = sorted((_player_projection(player) for player in roster), reverse=True)[:9]
-        projected[str(team_id)] = round(sum(top), 4)
+        top = sorted(row.projections, reverse=True)[:9]
+        projected[str(row.team_id)] = round(sum(top), 4)
     return projected
 
 
@@ -181,6 +266,8 @@ def _sleeper_players_for_roster(
     retries: int,
     backoff: float,
     warnings: List[str],
+    cache: Optional[ResponseCache] = None,
+    cache_ttl: float = 0.0,
 ) -> Dict[str, Any]:
     players_endpoint = str(
         endpoints.get("injury_players")
@@ -188,7 +275,8 @@ def _sleeper_players_for_roster(
         or DEFAULT_SLEEPER_PLAYERS_ENDPOINT
     )
     try:
-        payload = _http_get_json(players_endpoint, headers, timeout, retries, backoff)
+        players_ttl = max(cache_ttl, _PLAYERS_INDEX_TTL_SECONDS) if cache_ttl > 0 else 0.0
+        payload = _http_get_json(players_endpoint, headers, timeout, retries, backoff, cache, players_ttl)
         if isinstance(payload, dict):
             return payload
         warnings.append("sleeper_players_not_object")
@@ -204,6 +292,8 @@ def _free_weather_payload(
     timeout: float,
     retries: int,
     backoff: float,
+    cache: Optional[ResponseCache] = None,
+    cache_ttl: float = 0.0,
 ) -> Dict[str, Any]:
     warnings: List[str] = []
     quality_flags = ["free_api_mode"]
@@ -213,19 +303,12 @@ def _free_weather_payload(
     weather_endpoint = str(endpoint_map.get("weather_forecast") or DEFAULT_WEATHER_ENDPOINT)
     lat = _safe_float(endpoint_map.get("weather_lat"), 39.9008)
     lon = _safe_float(endpoint_map.get("weather_lon"), -75.1675)
-    weather_url = _with_query(
-        weather_endpoint,
-        {
-            "latitude": lat,
-            "longitude": lon,
-            "current": "wind_speed_10m,precipitation_probability",
-            "wind_speed_unit": "mph",
-            "forecast_days": 1,
-        },
-    )
+    weather_url = _weather_url(weather_endpoint, lat, lon)
 
     try:
-        payload = _http_get_json(weather_url, headers, timeout, retries, backoff)
+        payload = _http_get_json(
+            weather_url, headers, timeout, retries, backoff, cache, min(cache_ttl, _WEATHER_TTL_SECONDS)
+        )
         current = _as_dict(_as_dict(payload).get("current", {}))
         wind_mph = _safe_float(current.get("wind_speed_10m"), wind_mph)
         precip_prob = _safe_float(current.get("precipitation_probability"), precip_prob)
@@ -238,13 +321,13 @@ def _free_weather_payload(
         warnings.append(f"weather_free_source_failed:{exc}")
 
     is_dome_default = str(endpoint_map.get("weather_is_dome_default", "")).strip().lower() in {"1", "true", "yes"}
-    teams = list(getattr(league, "teams", []) or [])
+    teams = _league_rosters(league)
     team_weather: Dict[str, Dict[str, Any]] = {}
-    for index, team in enumerate(teams):
-        team_id = _team_id(team)
+    for index, row in enumerate(teams):
+        team_id = row.team_id
         if team_id is None:
             continue
-        nfl_team = _top_qb_nfl_team(team)
+        nfl_team = _top_qb_nfl_team(row)
         is_dome = is_dome_default or nfl_team in DOME_NFL_TEAMS
         offset = ((index % 3) - 1) * 1.25
         team_weather[str(team_id)] = {
@@ -269,8 +352,10 @@ def _free_market_payload(
     timeout: float,
     retries: int,
     backoff: float,
+    cache: Optional[ResponseCache] = None,
+    cache_ttl: float = 0.0,
 ) -> Dict[str, Any]:
-    teams = list(getattr(league, "teams", []) or [])
+    teams = _league_rosters(league)
     warnings: List[str] = []
     quality_flags = ["free_api_mode"]
 
@@ -280,25 +365,27 @@ def _free_market_payload(
     trending_add_endpoint = str(endpoint_map.get("market_trending_add") or DEFAULT_SLEEPER_ADD_ENDPOINT)
     trending_drop_endpoint = str(endpoint_map.get("market_trending_drop") or DEFAULT_SLEEPER_DROP_ENDPOINT)
 
-    try:
-        add_rows = _as_list(_http_get_json(trending_add_endpoint, headers, timeout, retries, backoff))
-        for row in add_rows:
+    (add_payload, add_error), (drop_payload, drop_error) = _http_get_json_many(
+        [trending_add_endpoint, trending_drop_endpoint], headers, timeout, retries, backoff, cache, cache_ttl
+    )
+
+    if add_error is None:
+        for row in _as_list(add_payload):
             row = _as_dict(row)
             pid = str(row.get("player_id", "")).strip()
             if pid:
                 add_counts[pid] = _safe_float(row.get("count"), 0.0)
-    except Exception as exc:
-        warnings.append(f"sleeper_trending_add_failed:{exc}")
+    else:
+        warnings.append(f"sleeper_trending_add_failed:{add_error}")
 
-    try:
-        drop_rows = _as_list(_http_get_json(trending_drop_endpoint, headers, timeout, retries, backoff))
-        for row in drop_rows:
+    if drop_error is None:
+        for row in _as_list(drop_payload):
             row = _as_dict(row)
             pid = str(row.get("player_id", "")).strip()
             if pid:
                 drop_counts[pid] = _safe_float(row.get("count"), 0.0)
-    except Exception as exc:
-        warnings.append(f"sleeper_trending_drop_failed:{exc}")
+    else:
+        warnings.append(f"sleeper_trending_drop_failed:{drop_error}")
 
     if add_counts or drop_counts:
         quality_flags.extend(["live_fetch", "free_api_sleeper_trending"])
@@ -313,11 +400,9 @@ def _free_market_payload(
     sentiment: Dict[str, Any] = {}
     ownership: Dict[str, float] = {}
 
-    for team in teams:
-        roster = list(getattr(team, "roster", []) or [])
-        for player in roster:
+    for row in teams:
+        for player, projection in zip(row.roster, row.projections):
             pid = _player_id(player)
-            projection = _player_projection(player)
             projections[pid] = round(projection, 4)
 
             add_value = _safe_float(add_counts.get(pid), 0.0)
@@ -346,6 +431,13 @@ def _free_market_payload(
     }
 
 
+def _source_injury_status(sleeper_index: Dict[str, Any], pid: str, player: Any) -> Any:
+    sleeper_row = sleeper_index.get(pid)
+    if isinstance(sleeper_row, dict) and "injury_status" in sleeper_row:
+        return sleeper_row["injury_status"]
+    return getattr(player, "injuryStatus", "NONE")
+
+
 def _free_injury_payload(
     endpoint_map: Dict[str, Any],
     headers: Dict[str, str],
@@ -353,12 +445,16 @@ def _free_injury_payload(
     timeout: float,
     retries: int,
     backoff: float,
+    cache: Optional[ResponseCache] = None,
+    cache_ttl: float = 0.0,
 ) -> Dict[str, Any]:
-    teams = list(getattr(league, "teams", []) or [])
+    teams = _league_rosters(league)
     warnings: List[str] = []
     quality_flags = ["free_api_mode"]
 
-    sleeper_index = _sleeper_players_for_roster(endpoint_map, headers, timeout, retries, backoff, warnings)
+    sleeper_index = _sleeper_players_for_roster(
+        endpoint_map, headers, timeout, retries, backoff, warnings, cache, cache_ttl
+    )
     if sleeper_index:
         quality_flags.extend(["live_fetch", "free_api_sleeper_injuries"])
     else:
@@ -368,42 +464,36 @@ def _free_injury_payload(
     injuries_by_team: Dict[str, Dict[str, int]] = {}
     backup_ratio: Dict[str, float] = {}
 
-    for team in teams:
-        team_id = _team_id(team)
+    for row in teams:
+        team_id = row.team_id
         if team_id is None:
             continue
-        roster = list(getattr(team, "roster", []) or [])
         injuries_by_team[str(team_id)] = {}
-        by_pos: Dict[str, List[Any]] = {}
-        for player in roster:
-            by_pos.setdefault(_player_position(player), []).append(player)
+        by_pos: Dict[str, List[Tuple[Any, float]]] = {}
+        for player, projection in zip(row.roster, row.projections):
+            by_pos.setdefault(_player_position(player), []).append((player, projection))
 
         for position, players in by_pos.items():
-            ordered = sorted(players, key=lambda item: _player_projection(item), reverse=True)
-            for index, player in enumerate(ordered):
-                pid = _player_id(player)
-                sleeper_row = _as_dict(sleeper_index.get(pid, {}))
-                source_status = sleeper_row.get("injury_status", getattr(player, "injuryStatus", "NONE"))
-                status = _normalize_status(source_status)
+            ordered = sorted(players, key=lambda item: item[1], reverse=True)
+            pids = [_player_id(player) for player, _ in ordered]
+            statuses = [
+                _normalize_status(_source_injury_status(sleeper_index, pid, player))
+                for pid, (player, _) in zip(pids, ordered)
+            ]
+            backup_projs = [0.0] * len(ordered)
+            next_available = 0.0
+            for index in range(len(ordered) - 1, -1, -1):
+                backup_projs[index] = next_available
+                if statuses[index] not in OUTLIKE_STATUSES:
+                    next_available = ordered[index][1]
+
+            for index, (pid, status) in enumerate(zip(pids, statuses)):
                 injury_status[pid] = status
 
                 if status in OUTLIKE_STATUSES or status == "QUESTIONABLE":
                     injuries_by_team[str(team_id)][position] = injuries_by_team[str(team_id)].get(position, 0) + 1
-                    baseline = max(0.01, _player_projection(player))
-                    backup = None
-                    for candidate in ordered[index + 1 :]:
-                        candidate_pid = _player_id(candidate)
-                        candidate_status = _normalize_status(
-                            _as_dict(sleeper_index.get(candidate_pid, {})).get(
-                                "injury_status",
-                                getattr(candidate, "injuryStatus", "NONE"),
-                            )
-                        )
-                        if candidate_status not in OUTLIKE_STATUSES:
-                            backup = candidate
-                            break
-                    backup_proj = _player_projection(backup) if backup is not None else 0.0
-                    backup_ratio[pid] = round(_clip(backup_proj / baseline, 0.0, 1.0), 4)
+                    baseline = max(0.01, ordered[index][1])
+                    backup_ratio[pid] = round(_clip(backup_projs[index] / baseline, 0.0, 1.0), 4)
 
     return {
         "data": {
@@ -425,6 +515,8 @@ def _odds_market_bias(
     retries: int,
     backoff: float,
     warnings: List[str],
+    cache: Optional[ResponseCache] = None,
+    cache_ttl: float = 0.0,
 ) -> Tuple[Optional[float], Optional[float], List[str]]:
     flags: List[str] = []
     api_key = str(api_keys.get("odds") or "").strip()
@@ -436,7 +528,9 @@ def _odds_market_bias(
     totals: List[float] = []
     spreads: List[float] = []
     try:
-        rows = _as_list(_http_get_json(odds_url, headers, timeout, retries, backoff))
+        rows = _as_list(
+            _http_get_json(odds_url, headers, timeout, retries, backoff, cache, min(cache_ttl, _ODDS_TTL_SECONDS))
+        )
         for event in rows:
             event = _as_dict(event)
             for book in _as_list(event.get("bookmakers")):
@@ -477,8 +571,10 @@ def _free_odds_payload(
     timeout: float,
     retries: int,
     backoff: float,
+    cache: Optional[ResponseCache] = None,
+    cache_ttl: float = 0.0,
 ) -> Dict[str, Any]:
-    teams = list(getattr(league, "teams", []) or [])
+    teams = _league_rosters(league)
     warnings: List[str] = []
     quality_flags = ["free_api_mode", "free_api_heuristic_odds"]
 
@@ -490,6 +586,8 @@ def _free_odds_payload(
         retries=retries,
         backoff=backoff,
         warnings=warnings,
+        cache=cache,
+        cache_ttl=cache_ttl,
     )
     for flag in market_flags:
         if flag not in quality_flags:
@@ -507,14 +605,14 @@ def _free_odds_payload(
     defense_vs_position: Dict[str, Dict[str, float]] = {}
     player_props: Dict[str, Dict[str, float]] = {}
 
-    for team in teams:
-        team_id = _team_id(team)
+    for row in teams:
+        team_id = row.team_id
         if team_id is None:
             continue
         key = str(team_id)
         own_total = _safe_float(projected_totals.get(key), 0.0)
         opp = None
-        schedule = list(getattr(team, "schedule", []) or [])
+        schedule = list(getattr(row.team, "schedule", []) or [])
         if 0 <= int(week) - 1 < len(schedule):
             opp = schedule[int(week) - 1]
         opp_id = _team_id(opp) if opp is not None else None
@@ -533,24 +631,24 @@ def _free_odds_payload(
         implied_totals[key] = round(implied, 4)
 
         probability = 1.0 / (1.0 + math.exp(spread / 5.5))
-        win_prob[key] = round(_clip(probability, 0.0, 1.0), 4)
+        win_prob[key] = round(max(0.0, min(1.0, probability)), 4)
         live_state[key] = {
             "quarter": 1,
             "time_remaining_sec": 3600.0,
             "score_differential": 0.0,
         }
 
+        edge = -spread
         defense_vs_position[key] = {
-            "QB": round(_clip(-spread / 10.0, -1.5, 1.5), 4),
-            "RB": round(_clip(-spread / 12.0, -1.5, 1.5), 4),
-            "WR": round(_clip(-spread / 11.0, -1.5, 1.5), 4),
-            "TE": round(_clip(-spread / 14.0, -1.5, 1.5), 4),
+            "QB": round(max(-1.5, min(1.5, edge / 10.0)), 4),
+            "RB": round(max(-1.5, min(1.5, edge / 12.0)), 4),
+            "WR": round(max(-1.5, min(1.5, edge / 11.0)), 4),
+            "TE": round(max(-1.5, min(1.5, edge / 14.0)), 4),
         }
 
-        roster = list(getattr(team, "roster", []) or [])
-        for player in roster:
+        for player, projection in zip(row.roster, row.projections):
             pid = _player_id(player)
-            base_line = max(0.0, _player_projection(player))
+            base_line = max(0.0, projection)
             started_pct = _clip(_safe_float(getattr(player, "percent_started", 50.0)) / 100.0, 0.0, 1.0, 0.5)
             player_props[pid] = {
                 "line_open": round(base_line * 0.95, 4),
@@ -576,47 +674,104 @@ def _free_odds_payload(
     }
 
 
+NEXTGEN_METRIC_NAMES = (
+    "usage_over_expected",
+    "route_participation",
+    "avg_separation",
+    "explosive_play_rate",
+    "volatility_index",
+    "red_zone_touch_share",
+    "red_zone_touch_trend",
+    "snap_share",
+    "snap_share_trend",
+)
+_ROUTE_BASE_BY_POSITION = {"QB": 1.0, "WR": 0.72, "TE": 0.72, "RB": 0.58}
+_SEPARATION_BASE_BY_POSITION = {"RB": 1.4, "WR": 2.0, "TE": 2.0}
+
+
+def _nextgen_metrics(
+    baseline: np.ndarray,
+    team_total: np.ndarray,
+    started_pct: np.ndarray,
+    route_base: np.ndarray,
+    separation_base: np.ndarray,
+    recent_points: np.ndarray,
+    recent_count: np.ndarray,
+) -> np.ndarray:
+    # Returns the (players, 9) metric matrix in NEXTGEN_METRIC_NAMES order, unrounded.
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        current_avg, prev_avg = window_averages(recent_points, recent_count, baseline)
+
+        window_n = np.minimum(recent_count, 4.0)
+        window = recent_points[:, :4]
+        mean = window.sum(axis=1) / np.maximum(window_n, 1.0)
+        in_window = np.arange(4) < window_n[:, None]
+        deviations = np.where(in_window, window - mean[:, None], 0.0)
+        volatility = np.where(recent_count >= 2, np.sqrt((deviations * deviations).sum(axis=1) / np.maximum(window_n, 1.0)), 0.0)
+
+        usage_over_expected = clip_array(
+            (current_avg - baseline) / np.where(baseline > 1.0, baseline, 1.0), -3.0, 3.0, nan_to_high=True
+        )
+        trend = clip_array((current_avg - prev_avg) / np.where(baseline > 2.0, baseline, 2.0), -1.0, 1.0, nan_to_high=True)
+        avg_separation = separation_base + usage_over_expected * 0.2
+
+        metrics = np.empty((baseline.shape[0], len(NEXTGEN_METRIC_NAMES)))
+        metrics[:, 0] = usage_over_expected
+        metrics[:, 1] = clip_array(route_base + (started_pct - 0.5) * 0.15, 0.0, 1.0, nan_to_high=True)
+        metrics[:, 2] = np.where(avg_separation > 0.1, avg_separation, 0.1)
+        metrics[:, 3] = clip_array(
+            0.12 + np.abs(usage_over_expected) * 0.1 + started_pct * 0.12, 0.0, 1.0, nan_to_high=True
+        )
+        metrics[:, 4] = np.where(volatility > 0.0, volatility, 0.0)
+        metrics[:, 5] = clip_array((baseline / team_total) * 1.4, 0.0, 1.0, nan_to_high=True)
+        metrics[:, 6] = trend
+        metrics[:, 7] = clip_array(started_pct * 0.9 + 0.1, 0.0, 1.0, nan_to_high=True)
+        metrics[:, 8] = clip_array(trend * 0.4, -1.0, 1.0, nan_to_high=True)
+    return metrics
+
+
 def _free_nextgen_payload(league: Any, week: int) -> Dict[str, Any]:
-    teams = list(getattr(league, "teams", []) or [])
+    teams = _league_rosters(league)
     quality_flags = ["free_api_mode", "free_api_heuristic_nextgenstats"]
     warnings: List[str] = []
     metrics: Dict[str, Dict[str, float]] = {}
 
-    for team in teams:
-        roster = list(getattr(team, "roster", []) or [])
-        team_total = sum(max(0.0, _player_projection(player)) for player in roster) or 1.0
-        for player in roster:
-            pid = _player_id(player)
+    player_ids: List[str] = []
+    baselines: List[float] = []
+    team_totals: List[float] = []
+    started: List[float] = []
+    route_bases: List[float] = []
+    separation_bases: List[float] = []
+    recent_rows: List[List[float]] = []
+    recent_counts: List[int] = []
+    for row in teams:
+        team_total = sum(max(0.0, projection) for projection in row.projections) or 1.0
+        for player, projection in zip(row.roster, row.projections):
             pos = _player_position(player)
-            baseline = max(0.1, _player_projection(player))
-            points = _player_recent_points(player, week)
-            current_avg = statistics.mean(points[:3]) if points else baseline
-            prev_avg = statistics.mean(points[3:6]) if len(points) > 3 else baseline
-            volatility = statistics.pstdev(points[:4]) if len(points) >= 2 else 0.0
-            started_pct = _clip(_safe_float(getattr(player, "percent_started", 50.0)) / 100.0, 0.0, 1.0, 0.5)
-
-            usage_over_expected = _clip((current_avg - baseline) / max(1.0, baseline), -3.0, 3.0, 0.0)
-            route_base = 1.0 if pos == "QB" else 0.72 if pos in {"WR", "TE"} else 0.58 if pos == "RB" else 0.35
-            route_participation = _clip(route_base + ((started_pct - 0.5) * 0.15), 0.0, 1.0, route_base)
-            avg_separation = 1.4 if pos == "RB" else 2.0 if pos in {"WR", "TE"} else 1.1
-            avg_separation = max(0.1, avg_separation + (usage_over_expected * 0.2))
-            explosive_rate = _clip(0.12 + abs(usage_over_expected) * 0.1 + started_pct * 0.12, 0.0, 1.0, 0.15)
-            red_zone_share = _clip((baseline / team_total) * 1.4, 0.0, 1.0, 0.0)
-            trend = _clip((current_avg - prev_avg) / max(2.0, baseline), -1.0, 1.0, 0.0)
-            snap_share = _clip(started_pct * 0.9 + 0.1, 0.0, 1.0, started_pct)
-            snap_trend = _clip(trend * 0.4, -1.0, 1.0, 0.0)
-
-            metrics[pid] = {
-                "usage_over_expected": round(usage_over_expected, 4),
-                "route_participation": round(route_participation, 4),
-                "avg_separation": round(avg_separation, 4),
-                "explosive_play_rate": round(explosive_rate, 4),
-                "volatility_index": round(max(0.0, volatility), 4),
-                "red_zone_touch_share": round(red_zone_share, 4),
-                "red_zone_touch_trend": round(trend, 4),
-                "snap_share": round(snap_share, 4),
-                "snap_share_trend": round(snap_trend, 4),
-            }
+            points = _player_recent_points(player, week)[:6]
+            player_ids.append(_player_id(player))
+            baselines.append(max(0.1, projection))
+            team_totals.append(team_total)
+            started.append(_safe_float(getattr(player, "percent_started", 50.0)))
+            route_bases.append(_ROUTE_BASE_BY_POSITION.get(pos, 0.35))
+            separation_bases.append(_SEPARATION_BASE_BY_POSITION.get(pos, 1.1))
+            recent_rows.append(points + [0.0] * (6 - len(points)))
+            recent_counts.append(len(points))
+
+    if player_ids:
+        with np.errstate(invalid="ignore"):
+            started_pct = clip_array(np.array(started, dtype=float) / 100.0, 0.0, 1.0, nan_to_high=True)
+        matrix = _nextgen_metrics(
+            np.array(baselines, dtype=float),
+            np.array(team_totals, dtype=float),
+            started_pct,
+            np.array(route_bases, dtype=float),
+            np.array(separation_bases, dtype=float),
+            np.array(recent_rows, dtype=float).reshape(len(recent_rows), 6),
+            np.array(recent_counts, dtype=float),
+        )
+        for pid, row in zip(player_ids, matrix.tolist()):
+            metrics[pid] = {name: round(value, 4) for name, value in zip(NEXTGEN_METRIC_NAMES, row)}
 
     return {
         "data": {"player_metrics": metrics},
@@ -638,6 +793,8 @@ def fetch_free_feed(
     timeout: float,
     retries: int,
     backoff: float,
+    cache: Optional[ResponseCache] = None,
+    cache_ttl: float = 0.0,
 ) -> Dict[str, Any]:
     _ = endpoint
     name = str(feed_name or "").strip().lower()
@@ -650,6 +807,8 @@ def fetch_free_feed(
             timeout=timeout,
             retries=retries,
             backoff=backoff,
+            cache=cache,
+            cache_ttl=cache_ttl,
         )
     if name == "market":
         return _free_market_payload(
@@ -660,6 +819,8 @@ def fetch_free_feed(
             timeout=timeout,
             retries=retries,
             backoff=backoff,
+            cache=cache,
+            cache_ttl=cache_ttl,
         )
     if name in {"injury_news", "injury-news"}:
         return _free_injury_payload(
@@ -669,6 +830,8 @@ def fetch_free_feed(
             timeout=timeout,
             retries=retries,
             backoff=backoff,
+            cache=cache,
+            cache_ttl=cache_ttl,
         )
     if name == "odds":
         return _free_odds_payload(
@@ -680,6 +843,8 @@ def fetch_free_feed(
             timeout=timeout,
             retries=retries,
             backoff=backoff,
+            cache=cache,
+            cache_ttl=cache_ttl,
         )
     if name == "nextgenstats":
         return _free_nextgen_payload(league=league, week=week)
@@ -1,11 +1,17 @@
 import json
 import os
 import tempfile
+import threading
 from types import SimpleNamespace
-from unittest import TestCase
+from unittest import TestCase, mock
 
+import numpy as np
+
+from alpha_sim_framework.alpha_types import CompositeAlphaConfig
 from alpha_sim_framework.monte_carlo import MonteCarloSimulator
 from alpha_sim_framework.providers import CompositeSignalProvider
+from alpha_sim_framework.providers._array_ops import clip_array
+from alpha_sim_framework.providers.composite_alpha_provider import _percentile
 
 
 class FakePlayer:
@@ -252,6 +258,238 @@ class CompositeSignalProviderTest(TestCase):
 
         self.assertEqual(first, second)
 
+    def test_config_instance_is_copied_before_overrides(self):
+        config = CompositeAlphaConfig()
+        config.external_feeds.endpoints["weather"] = "https://example.com/weather"
+
+        provider = CompositeSignalProvider(config, runtime={"timeout_seconds": 9.0}, weights={"usage_trend": 0.5})
+        provider.config.external_feeds.endpoints["market"] = "https://example.com/market"
+
+        self.assertEqual(provider.config.runtime.timeout_seconds, 9.0)
+        self.assertEqual(provider.config.weights.usage_trend, 0.5)
+        self.assertEqual(config.runtime.timeout_seconds, 2.0)
+        self.assertEqual(config.weights.usage_trend, 0.12)
+        self.assertEqual(config.external_feeds.endpoints, {"weather": "https://example.com/weather"})
+
+    def test_cached_week_payload_is_not_mutated_through_public_accessors(self):
+        league = _build_league()
+        provider = CompositeSignalProvider(**_provider_kwargs())
+
+        first = provider.get_player_adjustments(league, week=3)
+        first[101] = 999.0
+        provider.last_diagnostics[101]["signals"]["projection_residual"] = 999.0
+        provider.last_warnings.append("mutated")
+
+        second = provider.get_player_adjustments(league, week=3)
+        self.assertNotEqual(second[101], 999.0)
+        self.assertNotEqual(provider.last_diagnostics[101]["signals"]["projection_residual"], 999.0)
+        self.assertNotIn("mutated", provider.last_warnings)
+
+    def test_week_cache_is_bounded_and_evicts_least_recently_used(self):
+        league = _build_league()
+        kwargs = _provider_kwargs()
+        kwargs["runtime"]["cache_max_entries"] = 2
+        provider = CompositeSignalProvider(**kwargs)
+
+        first = provider._get_week_payload(league, 1)
+        provider._get_week_payload(league, 2)
+        self.assertIs(provider._get_week_payload(league, 1), first)
+        provider._get_week_payload(league, 3)
+
+        self.assertEqual([key[-1] for key in provider._week_cache], [1, 3])
+        self.assertLessEqual(len(provider._feed_cache), 2)
+
+    def test_week_cache_expires_on_monotonic_clock(self):
+        league = _build_league()
+        provider = CompositeSignalProvider(**_provider_kwargs())
+        target = "alpha_sim_framework.providers.composite_alpha_provider.time.monotonic"
+        with mock.patch(target, return_value=1000.0):
+            first = provider._get_week_payload(league, 3)
+        with mock.patch(target, return_value=1300.0):
+            self.assertIs(provider._get_week_payload(league, 3), first)
+        with mock.patch(target, return_value=1301.0):
+            self.assertIsNot(provider._get_week_payload(league, 3), first)
+
+    def test_expired_cache_entries_are_swept_on_store(self):
+        league = _build_league()
+        provider = CompositeSignalProvider(**_provider_kwargs())
+        target = "alpha_sim_framework.providers.composite_alpha_provider.time.monotonic"
+        with mock.patch(target, return_value=1000.0):
+            provider._get_week_payload(league, 3)
+        with mock.patch(target, return_value=1400.0):
+            provider._get_week_payload(league, 4)
+
+        self.assertEqual([key[-1] for key in provider._week_cache], [4])
+        self.assertEqual({key[-1] for key in provider._feed_cache}, {4})
+
+    def test_diagnostics_can_be_disabled(self):
+        league = _build_league()
+        provider = CompositeSignalProvider(**_provider_kwargs_extended())
+        quiet = CompositeSignalProvider(collect_diagnostics=False, **_provider_kwargs_extended())
+
+        self.assertEqual(quiet.get_player_adjustments(league, 3), provider.get_player_adjustments(league, 3))
+        self.assertEqual(quiet.get_matchup_overrides(league, 3), provider.get_matchup_overrides(league, 3))
+        self.assertEqual(quiet.last_diagnostics, {})
+        self.assertTrue(provider.last_diagnostics)
+
+    def test_diagnostics_json_matches_diagnostics(self):
+        provider = CompositeSignalProvider(**_provider_kwargs_extended())
+        provider.get_player_adjustments(_build_league(), 3)
+
+        expected = {str(pid): value for pid, value in provider.last_diagnostics.items()}
+        self.assertEqual(json.loads(provider.last_diagnostics_json()), json.loads(json.dumps(expected)))
+
+    def test_diagnostics_view_matches_diagnostics(self):
+        provider = CompositeSignalProvider(**_provider_kwargs_extended())
+        provider.get_player_adjustments(_build_league(), 3)
+
+        view = provider.last_diagnostics_view
+        self.assertEqual(dict(view), provider.last_diagnostics)
+        pid = next(iter(view))
+        self.assertIs(view[pid]["nextgen_metrics"], provider._last_diagnostics[pid].nextgen_metrics)
+
+    def test_adjustment_vectors_gather_a_roster_with_one_index(self):
+        league = _build_league()
+        provider = CompositeSignalProvider(**_provider_kwargs())
+        pid_index, adjustments, overrides = provider.get_adjustment_vectors(league, 3)
+        player_adjustments = provider.get_player_adjustments(league, 3)
+        matchup_overrides = provider.get_matchup_overrides(league, 3)
+
+        self.assertEqual(set(pid_index), set(player_adjustments))
+        roster = [player.playerId for player in league.teams[0].roster]
+        rows = np.array([pid_index[pid] for pid in roster])
+        self.assertEqual(adjustments[rows].tolist(), [player_adjustments[pid] for pid in roster])
+        self.assertEqual(overrides[rows].tolist(), [matchup_overrides[pid] for pid in roster])
+
+        adjustments[:] = 0.0
+        self.assertEqual(provider.get_player_adjustments(league, 3), player_adjustments)
+
+    def test_signal_plan_is_reused_until_weights_are_replaced(self):
+        provider = CompositeSignalProvider(**_provider_kwargs())
+
+        first = provider._signal_plan()
+        self.assertIs(first, provider._signal_plan())
+        self.assertAlmostEqual(float(first[1].sum()), 1.0)
+
+        provider.config.weights = type(provider.config.weights)(projection_residual=0.0)
+        rebuilt = provider._signal_plan()
+        self.assertIsNot(first, rebuilt)
+        self.assertEqual(float(rebuilt[1][0]), 0.0)
+
+    def test_contract_settings_follow_runtime_reassignment(self):
+        provider = CompositeSignalProvider(**_provider_kwargs())
+        mode, domains = provider._contract_settings()
+        self.assertEqual(mode, "warn")
+        self.assertIs(provider._contract_settings()[1], domains)
+
+        provider.config.runtime.canonical_contract_mode = "OFF"
+        provider.config.runtime.canonical_contract_domains = ["Weather"]
+        self.assertEqual(provider._contract_settings(), ("off", frozenset({"weather"})))
+
+    def test_int_and_string_feed_keys_resolve_identically(self):
+        league = _build_league()
+        string_keyed = CompositeSignalProvider(**_provider_kwargs())
+
+        int_kwargs = _provider_kwargs()
+        static_payloads = int_kwargs["external_feeds"]["static_payloads"]
+        for feed in static_payloads.values():
+            for field_name, mapping in list(feed.items()):
+                feed[field_name] = {int(key): value for key, value in mapping.items()}
+        int_keyed = CompositeSignalProvider(**int_kwargs)
+
+        self.assertEqual(
+            string_keyed.get_player_adjustments(league, week=3),
+            int_keyed.get_player_adjustments(league, week=3),
+        )
+
+    def test_float32_signal_passes_stay_close_to_float64(self):
+        league = _build_league()
+        kwargs = _provider_kwargs_extended()
+        reference = CompositeSignalProvider(**kwargs).get_player_adjustments(league, 3)
+        kwargs = _provider_kwargs_extended()
+        kwargs["runtime"]["signal_float32"] = True
+        narrowed = CompositeSignalProvider(**kwargs).get_player_adjustments(league, 3)
+
+        self.assertEqual(set(narrowed), set(reference))
+        for pid, value in reference.items():
+            self.assertIsInstance(narrowed[pid], float)
+            self.assertAlmostEqual(narrowed[pid], value, places=5)
+
+    def test_replacement_percentile_matches_numpy(self):
+        samples = [[7.5], [3.0, 9.0], [12.0, 4.5, 4.5, 18.2, 0.0, 9.9, 6.1], list(range(17, 0, -1))]
+        for values in samples:
+            self.assertAlmostEqual(_percentile(values, 35.0), float(np.percentile(values, 35)), places=12)
+        self.assertEqual(_percentile([], 35.0), 0.0)
+
+    def test_clip_array_nan_handling(self):
+        values = np.array([-2.0, 0.5, 2.0, float("nan")])
+        np.testing.assert_array_equal(clip_array(values, 0.0, 1.0), np.clip(values, 0.0, 1.0))
+        self.assertEqual(
+            clip_array(values, 0.0, 1.0, nan_to_high=True).tolist(),
+            [max(0.0, min(1.0, value)) for value in values.tolist()],
+        )
+
+    def test_async_feed_clients_are_gathered(self):
+        league = _build_league()
+        expected = CompositeSignalProvider(**_provider_kwargs()).get_player_adjustments(league, week=3)
+
+        provider = CompositeSignalProvider(**_provider_kwargs())
+        weather_client = provider._feeds["weather"]
+        calls = []
+
+        async def _fetch_async(league_arg, week_arg):
+            calls.append(week_arg)
+            return weather_client.fetch(league_arg, week_arg)
+
+        weather_client.fetch_async = _fetch_async
+        market_client = provider._feeds["market"]
+        fetch = market_client.fetch
+        threads = []
+
+        def _fetch(league_arg, week_arg):
+            threads.append(threading.current_thread().name)
+            return fetch(league_arg, week_arg)
+
+        market_client.fetch = _fetch
+        self.assertEqual(provider.get_player_adjustments(league, week=3), expected)
+        self.assertEqual(calls, [3])
+        self.assertTrue(threads and threads[0].startswith("alpha-feed"))
+        provider.close()
+
+    def test_feed_clients_are_built_on_first_use(self):
+        provider = CompositeSignalProvider(**_provider_kwargs())
+        self.assertEqual(len(provider._feeds), 0)
+
+        weather_client = provider._feeds["weather"]
+        self.assertIs(provider._feeds["weather"], weather_client)
+        self.assertEqual(list(provider._feeds), ["weather"])
+
+        provider.get_player_adjustments(_build_league(), week=3)
+        self.assertEqual(set(provider._feeds), set(provider._feeds.names))
+
+    def test_feed_thread_pool_is_reused_across_weeks(self):
+        league = _build_league()
+        provider = CompositeSignalProvider(**_provider_kwargs())
+        provider.get_player_adjustments(league, week=3)
+        pool = provider._feed_pool
+        self.assertIsNotNone(pool)
+
+        provider.get_player_adjustments(league, week=4)
+        self.assertIs(provider._feed_pool, pool)
+
+        provider.close()
+        self.assertIsNone(provider._feed_pool)
+
+    def test_warm_feed_cache_skips_feed_pool(self):
+        league = _build_league()
+        provider = CompositeSignalProvider(**_provider_kwargs())
+        expected = provider.get_player_adjustments(league, week=3)
+        provider.close()
+        provider._week_cache.clear()
+
+        self.assertEqual(provider.get_player_adjustments(league, week=3), expected)
+        self.assertIsNone(provider._feed_pool)
+
     def test_graceful_degradation_on_feed_failure(self):
         league = _build_league()
         provider = CompositeSignalProvider(**_provider_kwargs())
@@ -265,6 +503,30 @@ class CompositeSignalProviderTest(TestCase):
         self.assertTrue(len(adjustments) > 0)
         self.assertTrue(any("weather_fetch_failed" in warning for warning in provider.last_warnings))
 
+    def test_failed_feed_fetch_is_negative_cached_briefly(self):
+        league = _build_league()
+        provider = CompositeSignalProvider(**_provider_kwargs())
+        calls = []
+
+        def _explode(_league, week):
+            calls.append(week)
+            raise RuntimeError("feed down")
+
+        provider._feeds["weather"].fetch = _explode
+        target = "alpha_sim_framework.providers.composite_alpha_provider.time.monotonic"
+        with mock.patch(target, return_value=1000.0):
+            provider.get_player_adjustments(league, week=3)
+        provider._week_cache.clear()
+        with mock.patch(target, return_value=1020.0):
+            provider.get_player_adjustments(league, week=3)
+        self.assertEqual(calls, [3])
+        self.assertTrue(any("weather_fetch_failed" in warning for warning in provider.last_warnings))
+
+        provider._week_cache.clear()
+        with mock.patch(target, return_value=1031.0):
+            provider.get_player_adjustments(league, week=3)
+        self.assertEqual(calls, [3, 3])
+
     def test_integration_with_monte_carlo_alpha_mode(self):
         league = _build_league()
         provider = CompositeSignalProvider(**_provider_kwargs())
@@ -1,10 +1,13 @@
 import os
+import urllib.error
+import urllib.parse
+from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
 from unittest import TestCase, mock
 
 from alpha_sim_framework.alpha_types import ExternalFeedConfig, ProviderRuntimeConfig
 from alpha_sim_framework.feed_contracts import build_empty_envelope, validate_canonical_feed, validate_feed_envelope
-from alpha_sim_framework.providers.feeds.common import JSONFeedClient
+from alpha_sim_framework.providers.feeds.common import JSONFeedClient, _league_query, _utc_now
 
 
 class FeedContractsTest(TestCase):
@@ -229,3 +232,139 @@ class FeedContractsTest(TestCase):
         self.assertEqual(seen["auth"], "Bearer secret-key")
         self.assertIn("live_fetch", payload["quality_flags"])
         self.assertIn("raw_payload_wrapped", payload["quality_flags"])
+
+    def test_json_feed_client_caches_live_responses_and_falls_back_to_stale(self):
+        config = ExternalFeedConfig(enabled=True, endpoints={"weather": "https://example.com/weather"})
+        client = JSONFeedClient("weather", config, ProviderRuntimeConfig(retries=0, cache_ttl_seconds=60))
+        league = SimpleNamespace(league_id=12, year=2025)
+
+        class _Resp:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, exc_type, exc, tb):
+                return False
+
+            def read(self):
+                return b'{"team_weather":{"1":{"is_dome":true,"wind_mph":0.0,"precip_prob":0.0}}}'
+
+        clock = "alpha_sim_framework.providers.feeds.common.time.monotonic"
+        with mock.patch("urllib.request.urlopen", return_value=_Resp()) as urlopen:
+            with mock.patch(clock, return_value=100.0):
+                first = client.fetch(league, week=7)
+                first["quality_flags"].append("mutated")
+            with mock.patch(clock, return_value=150.0):
+                second = client.fetch(league, week=7)
+        self.assertEqual(urlopen.call_count, 1)
+        self.assertNotIn("mutated", second["quality_flags"])
+        self.assertEqual(second["data"], first["data"])
+
+        with mock.patch("urllib.request.urlopen", side_effect=OSError("down")):
+            with mock.patch(clock, return_value=200.0):
+                stale = client.fetch(league, week=7)
+        self.assertIn("stale_cache_fallback", stale["quality_flags"])
+        self.assertNotIn("fetch_failed", stale["quality_flags"])
+        self.assertEqual(stale["data"], first["data"])
+
+        with mock.patch("urllib.request.urlopen", side_effect=OSError("down")):
+            with mock.patch(clock, return_value=100.0 + 3601.0):
+                expired = client.fetch(league, week=7)
+        self.assertIn("fetch_failed", expired["quality_flags"])
+        self.assertNotIn("stale_cache_fallback", expired["quality_flags"])
+        self.assertEqual(expired["data"], {})
+
+    def test_json_feed_client_evicts_least_recently_used_responses(self):
+        config = ExternalFeedConfig(enabled=True, endpoints={"weather": "https://example.com/weather"})
+        client = JSONFeedClient("weather", config, ProviderRuntimeConfig(retries=0, cache_max_entries=2))
+        league = SimpleNamespace(league_id=12, year=2025)
+
+        class _Resp:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, exc_type, exc, tb):
+                return False
+
+            def read(self):
+                return b'{"team_weather":{}}'
+
+        with mock.patch("urllib.request.urlopen", return_value=_Resp()) as urlopen:
+            client.fetch(league, week=7)
+            client.fetch(league, week=8)
+            client.fetch(league, week=7)
+            client.fetch(league, week=9)
+            self.assertEqual(urlopen.call_count, 3)
+            client.fetch(league, week=7)
+            self.assertEqual(urlopen.call_count, 3)
+            client.fetch(league, week=8)
+            self.assertEqual(urlopen.call_count, 4)
+
+    def test_utc_now_matches_datetime_isoformat(self):
+        epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+        for ns in (1_700_000_000_000_000_000, 1_700_000_000_123_456_789, 1_700_000_001_000_999_999):
+            with mock.patch("alpha_sim_framework.providers.feeds.common.time.time_ns", return_value=ns):
+                self.assertEqual(_utc_now(), (epoch + timedelta(microseconds=ns // 1000)).isoformat())
+
+    def test_league_query_matches_urlencode(self):
+        for league_id, year in ((12, 2025), ("a b&c", "2024"), ("", None)):
+            league = SimpleNamespace(league_id=league_id, year=year)
+            expected = urllib.parse.urlencode({"league_id": league_id, "year": year, "week": 7})
+            self.assertEqual(_league_query(league, 7), expected)
+
+    def test_json_feed_client_does_not_retry_client_errors(self):
+        config = ExternalFeedConfig(enabled=True, endpoints={"weather": "https://example.com/weather"})
+        client = JSONFeedClient("weather", config, ProviderRuntimeConfig(retries=2, backoff_seconds=0.0))
+        missing = urllib.error.HTTPError("https://example.com/weather", 404, "Not Found", {}, None)
+        with mock.patch("urllib.request.urlopen", side_effect=missing) as urlopen:
+            payload = client.fetch(SimpleNamespace(league_id=12, year=2025), week=7)
+        self.assertEqual(urlopen.call_count, 1)
+        self.assertIn("fetch_failed", payload["quality_flags"])
+
+        unavailable = urllib.error.HTTPError("https://example.com/weather", 503, "Unavailable", {}, None)
+        with mock.patch("urllib.request.urlopen", side_effect=unavailable) as urlopen:
+            client.fetch(SimpleNamespace(league_id=12, year=2025), week=8)
+        self.assertEqual(urlopen.call_count, 3)
+
+    def test_retry_backoff_is_exponential_with_jitter(self):
+        config = ExternalFeedConfig(enabled=True, endpoints={"weather": "https://example.com/weather"})
+        client = JSONFeedClient("weather", config, ProviderRuntimeConfig(retries=2, backoff_seconds=0.5))
+        unavailable = urllib.error.HTTPError("https://example.com/weather", 503, "Unavailable", {}, None)
+        with mock.patch("urllib.request.urlopen", side_effect=unavailable), mock.patch(
+            "alpha_sim_framework.providers.feeds._http.random.uniform", side_effect=[0.5, 1.5]
+        ) as uniform, mock.patch("alpha_sim_framework.providers.feeds._http.time.sleep") as sleep:
+            client.fetch(SimpleNamespace(league_id=12, year=2025), week=7)
+        uniform.assert_called_with(0.5, 1.5)
+        self.assertEqual([call.args[0] for call in sleep.call_args_list], [0.25, 1.5])
+
+    def test_json_feed_client_revalidates_expired_responses_with_etag(self):
+        config = ExternalFeedConfig(enabled=True, endpoints={"weather": "https://example.com/weather"})
+        client = JSONFeedClient("weather", config, ProviderRuntimeConfig(retries=0, cache_ttl_seconds=60))
+        league = SimpleNamespace(league_id=12, year=2025)
+
+        class _Resp:
+            headers = {"ETag": '"v1"'}
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, exc_type, exc, tb):
+                return False
+
+            def read(self):
+                return b'{"team_weather":{"1":{"is_dome":true,"wind_mph":0.0,"precip_prob":0.0}}}'
+
+        seen = {}
+
+        def _not_modified(request, timeout=0):
+            seen["if_none_match"] = request.get_header("If-none-match")
+            raise urllib.error.HTTPError(request.full_url, 304, "Not Modified", {}, None)
+
+        clock = "alpha_sim_framework.providers.feeds.common.time.monotonic"
+        with mock.patch(clock, return_value=100.0), mock.patch("urllib.request.urlopen", return_value=_Resp()):
+            first = client.fetch(league, week=7)
+        with mock.patch(clock, return_value=200.0), mock.patch("urllib.request.urlopen", side_effect=_not_modified):
+            revalidated = client.fetch(league, week=7)
+
+        self.assertEqual(seen["if_none_match"], '"v1"')
+        self.assertIn("not_modified", revalidated["quality_flags"])
+        self.assertEqual(revalidated["data"], first["data"])
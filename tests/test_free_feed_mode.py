@@ -1,9 +1,13 @@
 import json
+import threading
+import urllib.error
 from unittest import TestCase, mock
 
 from alpha_sim_framework.alpha_types import ExternalFeedConfig, ProviderRuntimeConfig
 from alpha_sim_framework.feed_contracts import validate_canonical_feed
+from alpha_sim_framework.providers.feeds._http import ResponseCache
 from alpha_sim_framework.providers.feeds.common import JSONFeedClient
+from alpha_sim_framework.providers.feeds.free_api import _safe_float, _weather_url, _with_query
 
 
 class _FakePlayer:
@@ -140,3 +144,103 @@ class FreeFeedModeTest(TestCase):
         self.assertGreater(usage_trend["101"], usage_trend["201"])
         self.assertIn("101", injury_payload["data"]["injury_status"])
         self.assertIn("201", injury_payload["data"]["injury_status"])
+
+    def test_free_market_keeps_trending_adds_when_drops_fail(self):
+        league = _league()
+        runtime = ProviderRuntimeConfig(timeout_seconds=0.1, retries=0)
+        threads = set()
+
+        def _fake_urlopen(request, timeout=0):
+            url = request.full_url
+            threads.add(threading.current_thread().name)
+            if "/trending/add" in url:
+                return _Resp([{"player_id": "101", "count": 40}])
+            if "/trending/drop" in url:
+                raise RuntimeError("drop_down")
+            raise RuntimeError(f"unexpected_url:{url}")
+
+        with mock.patch("alpha_sim_framework.providers.feeds.free_api.urllib.request.urlopen", side_effect=_fake_urlopen):
+            payload = JSONFeedClient("market", _free_config(), runtime).fetch(league, week=3)
+
+        self.assertGreater(payload["data"]["usage_trend"]["101"], 0.0)
+        self.assertEqual(payload["warnings"], ["sleeper_trending_drop_failed:drop_down"])
+        self.assertEqual(threads, {threading.current_thread().name})
+
+    def test_free_mode_does_not_retry_client_errors(self):
+        league = _league()
+        runtime = ProviderRuntimeConfig(timeout_seconds=0.1, retries=2, backoff_seconds=0.0)
+        missing = urllib.error.HTTPError("https://api.open-meteo.com/v1/forecast", 404, "Not Found", {}, None)
+
+        with mock.patch("alpha_sim_framework.providers.feeds.free_api.urllib.request.urlopen", side_effect=missing) as urlopen:
+            payload = JSONFeedClient("weather", _free_config(), runtime).fetch(league, week=3)
+
+        self.assertEqual(urlopen.call_count, 1)
+        self.assertIn("free_api_fallback", payload["quality_flags"])
+
+    def test_free_mode_reuses_cached_responses_across_weeks(self):
+        league = _league()
+        weather = {"current": {"wind_speed_10m": 17.0, "precipitation_probability": 35}}
+        client = JSONFeedClient("weather", _free_config(), ProviderRuntimeConfig(timeout_seconds=0.1, retries=0))
+
+        with mock.patch(
+            "alpha_sim_framework.providers.feeds.free_api.urllib.request.urlopen",
+            side_effect=lambda request, timeout=0: _Resp(weather),
+        ) as urlopen:
+            first = client.fetch(league, week=3)
+            second = client.fetch(league, week=4)
+
+        self.assertEqual(urlopen.call_count, 1)
+        self.assertEqual(first["data"], second["data"])
+        self.assertIn("live_fetch", second["quality_flags"])
+
+    def test_free_mode_weather_responses_expire_before_cache_ttl(self):
+        league = _league()
+        weather = {"current": {"wind_speed_10m": 17.0, "precipitation_probability": 35}}
+        client = JSONFeedClient("weather", _free_config(), ProviderRuntimeConfig(timeout_seconds=0.1, retries=0))
+        clock = "alpha_sim_framework.providers.feeds._http.time.monotonic"
+
+        with mock.patch(
+            "alpha_sim_framework.providers.feeds.free_api.urllib.request.urlopen",
+            side_effect=lambda request, timeout=0: _Resp(weather),
+        ) as urlopen:
+            with mock.patch(clock, return_value=100.0):
+                client.fetch(league, week=3)
+            fetched = urlopen.call_count
+            with mock.patch(clock, return_value=200.0):
+                client.fetch(league, week=3)
+            self.assertEqual(urlopen.call_count, fetched)
+            with mock.patch(clock, return_value=221.0):
+                client.fetch(league, week=3)
+            self.assertEqual(urlopen.call_count, 2 * fetched)
+
+    def test_safe_float_defaults_on_overflowing_int(self):
+        self.assertEqual(_safe_float(10**400, 1.5), 1.5)
+        self.assertEqual(_safe_float(7), 7.0)
+        self.assertEqual(_safe_float(None, 2.0), 2.0)
+
+    def test_response_cache_evicts_least_recently_used(self):
+        cache = ResponseCache(max_entries=2)
+        cache.put(("a", ()), 1)
+        cache.put(("b", ()), 2)
+        self.assertEqual(cache.get(("a", ()), 60.0)[1], 1)
+        cache.put(("c", ()), 3)
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get(("b", ()), 60.0))
+        self.assertEqual(cache.get(("a", ()), 60.0)[1], 1)
+        self.assertEqual(cache.get(("c", ()), 60.0)[1], 3)
+
+    def test_weather_url_matches_urlencoded_query(self):
+        for endpoint in ("https://api.open-meteo.com/v1/forecast", "https://example.com/forecast?key=1"):
+            for lat, lon in ((39.9008, -75.1675), (-33.5, 151.0), (1e-05, float("nan"))):
+                expected = _with_query(
+                    endpoint,
+                    {
+                        "latitude": lat,
+                        "longitude": lon,
+                        "current": "wind_speed_10m,precipitation_probability",
+                        "wind_speed_unit": "mph",
+                        "forecast_days": 1,
+                    },
+                )
+                self.assertEqual(_weather_url(endpoint, lat, lon), expected)